@@ -0,0 +1,138 @@
+# 파싱 -> 기간병합 -> 엑셀 저장 단계별 벤치마크
+# - 단계별 실행 시간(반복 측정의 최솟값/중앙값)과 최대 메모리(tracemalloc)를 JSON으로 기록
+# - --data-dir가 없으면 generate_samples로 가상 데이터를 임시 폴더에 만들어 측정
+# 사용 예: python benchmarks/bench_pipeline.py --researchers 5000 --periods 6 --files 20 --output bench_results.json
+
+import os
+import sys
+import json
+import glob
+import time
+import platform
+import argparse
+import datetime
+import tempfile
+import statistics
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+from participation_core import parse_txt_file
+from project_participation_excel import (
+    build_project_df, build_researcher_df, merge_participation_periods, save_merged_to_excel
+)
+from generate_samples import generate_samples
+
+# 단계 함수 fn을 repeat번 실행해 시간 측정 후, tracemalloc을 켜고 한 번 더 실행해 최대 메모리 측정
+# 반환: (측정 결과 dict, 마지막 실행 결과)
+def measure(fn, repeat, trace_memory=True):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - started)
+    stage = {
+        'seconds_min': min(timings),
+        'seconds_median': statistics.median(timings),
+        'repeat': repeat,
+    }
+    if trace_memory:
+        tracemalloc.start()
+        try:
+            result = fn()
+            stage['peak_bytes'] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return stage, result
+
+# 전체 파이프라인 단계별 측정
+def run_benchmark(txt_paths, output_dir, repeat=3, trace_memory=True):
+    input_bytes = sum(os.path.getsize(txt_path) for txt_path in txt_paths)
+    stages = {}
+
+    # 1. 파싱: parse_txt_file을 파일마다 순차 실행
+    def parse_all():
+        all_project_info = []
+        all_researcher_info = []
+        for txt_path in txt_paths:
+            project_info_list, researcher_info_list = parse_txt_file(txt_path)
+            all_project_info.extend(project_info_list)
+            all_researcher_info.extend(researcher_info_list)
+        return all_project_info, all_researcher_info
+    stage, (all_project_info, all_researcher_info) = measure(parse_all, repeat, trace_memory)
+    stage.update({
+        'input_files': len(txt_paths),
+        'input_bytes': input_bytes,
+        'output_rows': len(all_project_info) + len(all_researcher_info),
+        'mb_per_second': input_bytes / 1024 / 1024 / stage['seconds_min'],
+    })
+    stages['parse'] = stage
+
+    # 2. 기간병합: 과제정보/연구원정보 DataFrame을 만든 뒤 merge_participation_periods만 측정
+    project_df = build_project_df(all_project_info)
+    researcher_df = build_researcher_df(all_researcher_info, project_df)
+    stage, merged_df = measure(lambda: merge_participation_periods(researcher_df), repeat, trace_memory)
+    stage.update({'input_rows': len(researcher_df), 'output_rows': len(merged_df)})
+    stages['merge_periods'] = stage
+
+    # 3. 엑셀 저장: save_merged_to_excel 전체 (DataFrame 생성, 기간병합, 시트 기록 포함)
+    output_path = os.path.join(output_dir, 'bench_output.xlsx')
+    stage, _ = measure(lambda: save_merged_to_excel(all_project_info, all_researcher_info, output_path),
+                       repeat, trace_memory)
+    stage.update({
+        'input_rows': len(all_project_info) + len(all_researcher_info),
+        'researchers': int(researcher_df['성명'].nunique()),
+        'output_bytes': os.path.getsize(output_path),
+    })
+    stages['save_excel'] = stage
+    return stages
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='연구과제 참여이력 파이프라인 단계별 벤치마크')
+    parser.add_argument('--data-dir', default=None, help='측정할 txt 파일 폴더 (없으면 가상 데이터 생성)')
+    parser.add_argument('--projects', type=int, default=200, help='가상 데이터 과제 수 (기본값: 200)')
+    parser.add_argument('--researchers', type=int, default=500, help='가상 데이터 연구원 수 (기본값: 500)')
+    parser.add_argument('--periods', type=int, default=4, help='가상 데이터 연구원별 참여기간 수 (기본값: 4)')
+    parser.add_argument('--files', type=int, default=4, help='가상 데이터 파일 수 (기본값: 4)')
+    parser.add_argument('--seed', type=int, default=0, help='가상 데이터 난수 시드 (기본값: 0)')
+    parser.add_argument('--repeat', type=int, default=3, help='단계별 반복 측정 횟수 (기본값: 3)')
+    parser.add_argument('--no-memory', action='store_true', help='tracemalloc 메모리 측정 생략')
+    parser.add_argument('--output', default='bench_results.json', help='결과 JSON 경로 (기본값: bench_results.json)')
+    args = parser.parse_args(argv)
+    if args.repeat < 1:
+        parser.error('--repeat는 1 이상이어야 합니다')
+    return args
+
+def main(argv=None):
+    args = parse_args(argv)
+    with tempfile.TemporaryDirectory() as work_dir:
+        if args.data_dir:
+            txt_paths = sorted(glob.glob(os.path.join(args.data_dir, '*.txt')))
+            scale = {'data_dir': os.path.abspath(args.data_dir)}
+        else:
+            txt_paths = generate_samples(os.path.join(work_dir, 'data'), args.projects, args.researchers,
+                                         args.periods, args.files, args.seed)
+            scale = {'projects': args.projects, 'researchers': args.researchers,
+                     'periods': args.periods, 'files': args.files, 'seed': args.seed}
+        stages = run_benchmark(txt_paths, work_dir, args.repeat, not args.no_memory)
+    results = {
+        'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+        'environment': {
+            'python': platform.python_version(),
+            'pandas': pd.__version__,
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+        },
+        'scale': scale,
+        'stages': stages,
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    for name, stage in stages.items():
+        peak = f"{stage['peak_bytes'] / 1024 / 1024:8.1f} MB" if 'peak_bytes' in stage else '       -'
+        print(f"{name:15s} {stage['seconds_min']:8.3f} s (중앙값 {stage['seconds_median']:.3f} s)  최대 메모리 {peak}")
+    print(f"결과 저장: {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+# 시작(import) 시간 벤치마크
+# - 경우마다 새 파이썬 프로세스를 띄워 import 시간과 프로세스 전체 실행 시간(인터프리터 시작 포함)을 측정
+# - numpy/pandas/openpyxl이 실제로 로드됐는지 함께 기록 (participation_core, csv 배치 실행은 로드하지 않아야 함)
+# - 'batch_csv'/'batch_xlsx'는 작은 가상 데이터 하나를 파싱해 저장하는 하루치 증분 배치 실행에 해당
+# 사용 예: python benchmarks/bench_startup.py --repeat 10 --output startup_results.json
+
+import os
+import sys
+import json
+import platform
+import argparse
+import datetime
+import tempfile
+import statistics
+import subprocess
+import time
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+from generate_samples import generate_samples
+
+# 로드 여부를 기록할 무거운 패키지
+HEAVY_MODULES = ('numpy', 'pandas', 'openpyxl', 'streamlit')
+
+# 측정할 경우: {이름: 실행할 코드} ({data_dir}, {out_dir}는 가상 데이터/출력 폴더로 바뀜)
+STARTUP_CASES = {
+    'import_core': 'import participation_core',
+    'import_cli': 'import project_participation_excel',
+    'import_store': 'import participation_store',
+    'import_pandas': 'import pandas',
+    'batch_csv': (
+        'import os, project_participation_excel as ppe\n'
+        'paths = sorted(os.path.join({data_dir!r}, f) for f in os.listdir({data_dir!r}))\n'
+        'project_table, researcher_table = ppe.concat_parse_results(ppe.parse_txt_files(paths, workers=1))\n'
+        'ppe.save_merged_tables(project_table, researcher_table, os.path.join({out_dir!r}, "out"), "csv")'
+    ),
+    'batch_xlsx': (
+        'import os, project_participation_excel as ppe\n'
+        'paths = sorted(os.path.join({data_dir!r}, f) for f in os.listdir({data_dir!r}))\n'
+        'project_table, researcher_table = ppe.concat_parse_results(ppe.parse_txt_files(paths, workers=1))\n'
+        'ppe.save_merged_to_excel(project_table, researcher_table, os.path.join({out_dir!r}, "out.xlsx"))'
+    ),
+}
+
+# 자식 프로세스에서 실행: code 실행 시간과 로드된 무거운 패키지를 JSON 한 줄로 출력
+_CHILD_TEMPLATE = '''
+import sys, time, json
+started = time.perf_counter()
+{code}
+seconds = time.perf_counter() - started
+print(json.dumps({{'seconds': seconds, 'loaded': [m for m in {heavy!r} if m in sys.modules]}}))
+'''
+
+# 경우 하나를 새 프로세스에서 repeat번 실행
+def measure_case(code, repeat):
+    script = _CHILD_TEMPLATE.format(code=code, heavy=HEAVY_MODULES)
+    code_timings = []
+    process_timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        completed = subprocess.run([sys.executable, '-c', script], cwd=REPO_DIR, capture_output=True, text=True,
+                                   check=True)
+        process_timings.append(time.perf_counter() - started)
+        result = json.loads(completed.stdout.strip().splitlines()[-1])
+        code_timings.append(result['seconds'])
+    return {
+        'seconds_min': min(code_timings),
+        'seconds_median': statistics.median(code_timings),
+        'process_seconds_min': min(process_timings),
+        'process_seconds_median': statistics.median(process_timings),
+        'loaded': result['loaded'],
+        'repeat': repeat,
+    }
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='모듈 import 시간/배치 실행 시작 시간 벤치마크')
+    parser.add_argument('--cases', nargs='+', choices=list(STARTUP_CASES), default=list(STARTUP_CASES),
+                        help='측정할 경우 (기본값: 전체)')
+    parser.add_argument('--researchers', type=int, default=50, help='배치 실행 가상 데이터 연구원 수 (기본값: 50)')
+    parser.add_argument('--repeat', type=int, default=5, help='경우별 반복 측정 횟수 (기본값: 5)')
+    parser.add_argument('--output', default='startup_results.json', help='결과 JSON 경로 (기본값: startup_results.json)')
+    args = parser.parse_args(argv)
+    if args.repeat < 1:
+        parser.error('--repeat는 1 이상이어야 합니다')
+    if args.researchers < 1:
+        parser.error('--researchers는 1 이상이어야 합니다')
+    return args
+
+def main(argv=None):
+    args = parse_args(argv)
+    cases = {}
+    with tempfile.TemporaryDirectory() as work_dir:
+        data_dir = os.path.join(work_dir, 'data')
+        out_dir = os.path.join(work_dir, 'out')
+        os.makedirs(out_dir)
+        generate_samples(data_dir, projects=20, researchers=args.researchers, periods=4, files=1)
+        for name in args.cases:
+            code = STARTUP_CASES[name].format(data_dir=data_dir, out_dir=out_dir)
+            cases[name] = measure_case(code, args.repeat)
+    results = {
+        'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+        },
+        'scale': {'researchers': args.researchers},
+        'cases': cases,
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    for name, case in cases.items():
+        loaded = ', '.join(case['loaded']) or '-'
+        print(f"{name:15s} {case['seconds_min'] * 1000:8.1f} ms (중앙값 {case['seconds_median'] * 1000:.1f} ms)  "
+              f"프로세스 {case['process_seconds_min'] * 1000:8.1f} ms  로드: {loaded}")
+    print(f"결과 저장: {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+# 벤치마크용 가상 연구과제 참여확인서 txt 파일 생성
+# - 연구포털 일괄출력 형식(■ 과제정보 / ■ 연구원정보)과 같은 구조, cp949 인코딩, CRLF 줄바꿈
+# - 규모: 과제 수, 연구원 수, 연구원별 참여기간 수, 파일 수
+# 사용 예: python benchmarks/generate_samples.py --projects 500 --researchers 2000 --periods 6 --files 20 --out-dir bench_data
+
+import os
+import random
+import argparse
+import datetime
+
+SUPPORT_AGENCIES = ['한국연구재단', '정보통신기획평가원', '한국산업기술평가관리원', '한국보건산업진흥원', '과학기술정보통신부']
+SUPPORT_PROGRAMS = ['기초연구사업', '중견연구자지원사업', '산업기술혁신사업', 'ICT연구센터지원사업', '바이오의료기술개발사업']
+INSTITUTES = ['공학연구소', '기초과학연구소', '정보통신연구소', '의과학연구소', '에너지환경연구소']
+DEPARTMENTS = ['전기전자공학부', '컴퓨터학과', '화공생명공학과', '기계공학부', '바이오의공학부', '신소재공학부']
+RESEARCHER_TYPES = ['참여연구원', '공동연구원', '연구보조원']
+COURSE_TYPES = ['석사과정', '박사과정', '석박통합과정', '박사후과정', '학사']
+FAMILY_NAMES = '김이박최정강조윤장임한오서신권황안송류홍'
+GIVEN_NAME_SYLLABLES = '민서준지현우도윤하예은수진영재호성연주원'
+
+# 가상 과제 목록
+def make_projects(count, rng):
+    projects = []
+    for i in range(count):
+        start = datetime.date(2015, 1, 1) + datetime.timedelta(days=rng.randrange(0, 365 * 8))
+        end = start + datetime.timedelta(days=rng.choice([365, 730, 1095, 1826]) - 1)
+        projects.append({
+            '과제번호': f'2{start.year % 100:02d}{i:06d}',
+            '연구기간': f'{start} ~ {end}',
+            '과 제 명': f'{rng.choice(INSTITUTES)[:-3]} 분야 {rng.choice(["차세대", "지능형", "고효율", "융합"])} 기술 연구 {i}',
+            '연구책임자': rng.choice(FAMILY_NAMES) + ''.join(rng.choice(GIVEN_NAME_SYLLABLES) for _ in range(2)),
+            '지원기관': rng.choice(SUPPORT_AGENCIES),
+            '지원사업': rng.choice(SUPPORT_PROGRAMS),
+            '소속연구소': rng.choice(INSTITUTES),
+            '관리부서': '산학협력단',
+            '협약연구비': f'{rng.randrange(10, 2000) * 1000000:,}',
+            '공동연구원수': str(rng.randrange(0, 10)),
+            '연구보조원수': str(rng.randrange(0, 20)),
+            'start': start,
+            'end': end,
+        })
+    return projects
+
+# 가상 연구원 목록 (성명, 주민번호)
+def make_researchers(count, rng):
+    researchers = []
+    for i in range(count):
+        name = rng.choice(FAMILY_NAMES) + ''.join(rng.choice(GIVEN_NAME_SYLLABLES) for _ in range(2))
+        birth = datetime.date(1960, 1, 1) + datetime.timedelta(days=rng.randrange(0, 365 * 40))
+        jumin = f'{birth:%y%m%d}-{rng.choice("12")}******'
+        researchers.append((name, jumin))
+    return researchers
+
+# 과제 기간 안에서 이어지거나 떨어진 참여기간 period_count개
+def make_periods(project, period_count, rng):
+    periods = []
+    start = project['start']
+    for _ in range(period_count):
+        end = min(start + datetime.timedelta(days=rng.choice([90, 181, 365]) - 1), project['end'])
+        periods.append(f'{start} ~ {end}')
+        # 대부분은 다음날부터 바로 이어지고(기간 병합 대상), 일부는 공백을 둠
+        gap = 1 if rng.random() < 0.7 else rng.randrange(2, 120)
+        start = end + datetime.timedelta(days=gap)
+        if start > project['end']:
+            start = project['start']
+    return periods
+
+# 참여확인서 한 건 (과제 하나 + 연구원 한 명)
+def make_certificate(project, researcher, periods, rng):
+    name, jumin = researcher
+    lines = [
+        '연구과제 참여확인서',
+        '',
+        '■ 과제정보',
+        f"과제번호\t{project['과제번호']}\t연구기간\t{project['연구기간']}",
+        f"과 제 명\t{project['과 제 명']}",
+        f"연구책임자\t{project['연구책임자']}\t지원기관\t{project['지원기관']}",
+        f"지원사업\t{project['지원사업']}\t소속연구소\t{project['소속연구소']}",
+        f"관리부서\t{project['관리부서']}\t협약연구비\t{project['협약연구비']}",
+        f"공동연구원수\t{project['공동연구원수']}\t연구보조원수\t{project['연구보조원수']}",
+        '',
+        '■ 연구원정보',
+        f'성명: {name}\t주민번호: {jumin}',
+        '연구원구분\t과정구분\t소속\t참여기간',
+    ]
+    researcher_type = rng.choice(RESEARCHER_TYPES)
+    course_type = rng.choice(COURSE_TYPES)
+    department = rng.choice(DEPARTMENTS)
+    for period in periods:
+        lines.append(f'{researcher_type}\t{course_type}\t{department}\t{period}')
+    lines += ['', '-- 이하 여백 --', '', '2025년 06월 25일', '고려대학교 산학협력단장', '']
+    return '\r\n'.join(lines)
+
+# 가상 txt 파일 생성
+# - 연구원마다 periods개의 참여기간을 무작위 과제 몇 개에 나누어 배정 (과제+연구원 한 쌍 = 참여확인서 한 건)
+# - 참여확인서는 files개 파일에 번갈아 나누어 기록
+# 반환: 생성한 파일 경로 리스트
+def generate_samples(out_dir, projects=200, researchers=500, periods=4, files=4, seed=0):
+    rng = random.Random(seed)
+    os.makedirs(out_dir, exist_ok=True)
+    project_list = make_projects(projects, rng)
+    researcher_list = make_researchers(researchers, rng)
+    paths = [os.path.join(out_dir, f'sample_{i:04d}.txt') for i in range(files)]
+    handles = [open(path, 'w', encoding='cp949', newline='') for path in paths]
+    try:
+        certificate_no = 0
+        for researcher in researcher_list:
+            project_count = max(1, min(len(project_list), rng.randrange(1, periods + 1)))
+            chosen = rng.sample(project_list, project_count)
+            for i, project in enumerate(chosen):
+                # 참여기간 수를 과제별로 나눔 (앞 과제부터 나머지를 하나씩 더 받음)
+                period_count = periods // project_count + (1 if i < periods % project_count else 0)
+                if period_count == 0:
+                    continue
+                certificate = make_certificate(project, researcher, make_periods(project, period_count, rng), rng)
+                handles[certificate_no % files].write(certificate)
+                certificate_no += 1
+    finally:
+        for handle in handles:
+            handle.close()
+    return paths
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='벤치마크용 가상 연구과제 참여확인서 txt 파일 생성')
+    parser.add_argument('--projects', type=int, default=200, help='과제 수 (기본값: 200)')
+    parser.add_argument('--researchers', type=int, default=500, help='연구원 수 (기본값: 500)')
+    parser.add_argument('--periods', type=int, default=4, help='연구원별 참여기간 수 (기본값: 4)')
+    parser.add_argument('--files', type=int, default=4, help='파일 수 (기본값: 4)')
+    parser.add_argument('--seed', type=int, default=0, help='난수 시드 (기본값: 0)')
+    parser.add_argument('--out-dir', default='bench_data', help='출력 폴더 (기본값: bench_data)')
+    args = parser.parse_args(argv)
+    for option in ('projects', 'researchers', 'periods', 'files'):
+        if getattr(args, option) < 1:
+            parser.error(f'--{option}는 1 이상이어야 합니다')
+    return args
+
+if __name__ == "__main__":
+    args = parse_args()
+    paths = generate_samples(args.out_dir, args.projects, args.researchers, args.periods, args.files, args.seed)
+    total_size = sum(os.path.getsize(path) for path in paths)
+    print(f"{len(paths)}개 파일 생성 완료: {args.out_dir} ({total_size / 1024 / 1024:.1f} MB)")
@@ -0,0 +1,657 @@
+# 연구과제 참여확인서 파싱/기간병합 핵심 모듈 (표준 라이브러리만 사용)
+# - txt 파싱, 중복 참여확인서 판별, 병렬 파싱, 과제정보/연구원정보/기간통합 행 생성
+# - numpy/pandas/openpyxl을 import하지 않으므로 바로 로드됨 (배치 실행, 작업자 프로세스 시작이 빠름)
+# - 병렬 파싱용 concurrent.futures도 작업자가 2개 이상일 때만 import
+# - DataFrame이 필요할 때만 ColumnarTable.to_dataframe에서 numpy/pandas를 import
+
+import re
+import os
+import collections
+import hashlib
+import codecs
+import io
+import mmap
+import contextlib
+import itertools
+import datetime
+from array import array
+
+
+# 과제정보 항목(키): 과제정보 dict의 키 순서도 이 순서를 따른다
+PROJECT_KEYS = ['과제번호', '연구기간', '과 제 명', '연구책임자', '지원기관', '지원사업', '소속연구소', '관리부서', '협약연구비', '공동연구원수', '연구보조원수']
+_PROJECT_KEY_ORDER = {key: i for i, key in enumerate(PROJECT_KEYS)}
+# 연구원정보 항목: 연구원정보 dict의 키 / 연구원정보 행(tuple)의 순서
+RESEARCHER_KEYS = ['과제번호', '과 제 명', '성명', '주민번호', '연구원구분', '과정구분', '소속', '참여기간']
+
+# 스트리밍 파서가 생성하는 레코드 종류
+PROJECT_RECORD = 'project'
+RESEARCHER_RECORD = 'researcher'
+
+# 파서 상태 (과제 하나 = '연구과제 참여확인서' 단위)
+_SEEK_INFO = 0      # '■ 과제정보'를 찾는 중
+_IN_INFO = 1        # 과제정보 블록 안
+_IN_RESEARCHER = 2  # 연구원정보 블록 안
+_SKIP = 3           # 연구원정보 블록이 끝나 다음 과제까지 무시
+
+# 상태별로 의미 있는 표식만 찾는 미리 컴파일된 패턴
+# 그룹 1('연구과제 참여확인서')은 어느 상태에서든 새 과제의 시작
+_STATE_PATTERNS = {
+    _SEEK_INFO: re.compile(r'(연구과제 참여확인서)|■ 과제정보'),
+    _IN_INFO: re.compile(r'(연구과제 참여확인서)|■ 연구원정보'),
+    _IN_RESEARCHER: re.compile(r'(연구과제 참여확인서)|-- 이하 여백 --|202\d{1,4}년'),
+    _SKIP: re.compile(r'(연구과제 참여확인서)'),
+}
+# 그룹 1이 아닌 표식을 만났을 때의 다음 상태
+_NEXT_STATE = {_SEEK_INFO: _IN_INFO, _IN_INFO: _IN_RESEARCHER, _IN_RESEARCHER: _SKIP}
+_NAME_RE = re.compile(r'성명:\s*([^\t]+)')
+_JUMIN_RE = re.compile(r'주민번호:\s*([^\t]+)')
+
+# 과제정보 한 줄에서 '키\t값' 쌍을 찾아 values에 기록
+# 같은 키가 여러 번 나오면 마지막 값이 남고, first_seen에는 키가 처음 나온 줄 번호를 기록
+def _read_info_line(line, line_no, values, first_seen):
+    parts = line.split('\t')
+    for i in range(len(parts) - 1):
+        key = parts[i]
+        if key not in _PROJECT_KEY_ORDER:
+            key = key.strip()
+            if key not in _PROJECT_KEY_ORDER:
+                continue
+        values[key] = parts[i + 1].strip()
+        if key not in first_seen:
+            first_seen[key] = line_no
+
+# 과제정보 dict 완성: 키는 처음 나온 줄 순, 같은 줄 안에서는 PROJECT_KEYS 순
+def _build_info_dict(values, first_seen):
+    keys = sorted(values, key=lambda key: (first_seen[key], _PROJECT_KEY_ORDER[key]))
+    return {key: values[key] for key in keys}
+
+# 연구원정보 데이터 줄(연구원구분/과정구분/소속/참여기간) -> 연구원정보 행 (RESEARCHER_KEYS 순서의 tuple)
+def _build_researcher_row(line, project_number, project_name, name, jumin):
+    parts = line.strip().split('\t')
+    if len(parts) < 4:
+        return None
+    return (project_number, project_name, name, jumin,
+            parts[0].strip(), parts[1].strip(), parts[2].strip(), parts[3].strip())
+
+# 줄 단위 텍스트(텍스트 모드 파일 객체, 줄 리스트 등)에서 과제정보/연구원정보를 순서대로 생성
+# 생성값: (PROJECT_RECORD, 과제정보 dict) 또는 (RESEARCHER_RECORD, 연구원정보 행 tuple)
+# 파일 전체를 읽어 나누지 않고 한 줄씩 상태 머신으로 처리하므로 메모리 사용량이 파일 크기와 무관하다
+# 과제정보보다 먼저 나온 '■ 연구원정보'는 무시한다 (원래 정규식 구현은 이를 연구원 행으로 잘못 읽었음, tests/test_parser_golden.py)
+def iter_txt_rows(lines):
+    # 줄 끝의 '\n'은 각 블록 처리에서 strip으로 지워지므로 따로 제거하지 않는다
+    state = _SEEK_INFO
+    search = _STATE_PATTERNS[state].search
+    for line in lines:
+        pos = 0
+        while True:
+            match = search(line, pos)
+            if match is None:
+                segment = line[pos:] if pos else line
+            else:
+                segment = line[pos:match.start()]
+            # 1. 표식 앞부분(표식이 없으면 줄 전체)을 현재 블록의 한 줄로 처리
+            if state == _IN_INFO:
+                # 블록 마지막 줄은 뒤쪽 공백을 지우고 처리해야 하므로 한 줄씩 늦게 처리
+                if segment.strip():
+                    if pending_info is not None:
+                        _read_info_line(pending_info, info_line_no, values, first_seen)
+                        info_line_no += 1
+                    pending_info = segment
+            elif state == _IN_RESEARCHER:
+                # 첫 줄은 성명/주민번호, 둘째 줄은 머리글, 이후는 참여 이력
+                if researcher_line_no >= 2:
+                    row = _build_researcher_row(segment, project_number, project_name, name, jumin)
+                    if row is not None:
+                        yield RESEARCHER_RECORD, row
+                    researcher_line_no += 1
+                elif researcher_line_no == 1:
+                    researcher_line_no = 2
+                elif segment.strip():
+                    name = _NAME_RE.search(segment)
+                    jumin = _JUMIN_RE.search(segment)
+                    name = name.group(1).strip() if name else ''
+                    jumin = jumin.group(1).strip() if jumin else ''
+                    researcher_line_no = 1
+            if match is None:
+                break
+            # 2. 표식에 따른 상태 전이
+            pos = match.end()
+            if match.group(1):
+                state = _SEEK_INFO
+                search = _STATE_PATTERNS[state].search
+                continue
+            if state == _SEEK_INFO:
+                values, first_seen = {}, {}
+                pending_info, info_line_no = None, 0
+            elif state == _IN_INFO:
+                if pending_info is not None:
+                    _read_info_line(pending_info.rstrip(), info_line_no, values, first_seen)
+                project_number = values.get('과제번호', '')
+                project_name = values.get('과 제 명', '')
+                researcher_line_no = 0
+                if project_number:
+                    yield PROJECT_RECORD, _build_info_dict(values, first_seen)
+            state = _NEXT_STATE[state]
+            search = _STATE_PATTERNS[state].search
+
+# iter_txt_rows와 같지만 연구원정보도 dict로 생성
+# 생성값: (PROJECT_RECORD, 과제정보 dict) 또는 (RESEARCHER_RECORD, 연구원정보 dict)
+def iter_txt_records(lines):
+    for kind, record in iter_txt_rows(lines):
+        if kind == RESEARCHER_RECORD:
+            record = dict(zip(RESEARCHER_KEYS, record))
+        yield kind, record
+
+# 열 단위(columnar) 레코드 저장 구조
+# - 열마다 값을 사전(dictionary) 인코딩: 서로 다른 문자열은 한 번만 보관하고 행마다 4바이트 코드만 저장
+# - 행마다 dict를 만들지 않으므로 과제번호/과 제 명/성명처럼 반복되는 값이 많을수록 메모리가 크게 줄어듦
+# - None(항목 없음)은 코드 -1, DataFrame에서는 NaN
+class ColumnarTable:
+    def __init__(self, columns):
+        self.columns = list(columns)
+        self._codes = [array('i') for _ in self.columns]
+        self._lookups = [{} for _ in self.columns]
+        self._values = [[] for _ in self.columns]
+
+    def __len__(self):
+        return len(self._codes[0]) if self._codes else 0
+
+    # 행 하나 추가 (columns 순서의 값 시퀀스)
+    def append(self, row):
+        for codes, lookup, values, value in zip(self._codes, self._lookups, self._values, row):
+            if value is None:
+                codes.append(-1)
+                continue
+            code = lookup.get(value)
+            if code is None:
+                code = lookup[value] = len(values)
+                values.append(value)
+            codes.append(code)
+
+    # dict 레코드 하나 추가 (없는 키는 None)
+    def append_record(self, record):
+        self.append([record.get(column) for column in self.columns])
+
+    # 다른 표(같은 열 구성)의 행을 뒤에 이어 붙임: 값 사전을 합치고 코드만 바꿔 복사
+    def extend(self, other):
+        for column_index, column in enumerate(self.columns):
+            other_index = other.columns.index(column)
+            lookup = self._lookups[column_index]
+            values = self._values[column_index]
+            remap = []
+            for value in other._values[other_index]:
+                code = lookup.get(value)
+                if code is None:
+                    code = lookup[value] = len(values)
+                    values.append(value)
+                remap.append(code)
+            # 코드 -1(None)은 remap의 마지막 원소(-1)를 가리키게 됨
+            remap.append(-1)
+            self._codes[column_index].extend(map(remap.__getitem__, other._codes[other_index]))
+
+    # 주어진 위치(rows)의 행만 남긴 새 표 (값 사전도 남은 행이 쓰는 값만 남김)
+    def take(self, rows):
+        table = ColumnarTable(self.columns)
+        for codes, values, new_codes, lookup, new_values in zip(self._codes, self._values, table._codes,
+                                                                 table._lookups, table._values):
+            remap = {-1: -1}
+            for row in rows:
+                code = codes[row]
+                new_code = remap.get(code)
+                if new_code is None:
+                    value = values[code]
+                    new_code = remap[code] = lookup[value] = len(new_values)
+                    new_values.append(value)
+                new_codes.append(new_code)
+        return table
+
+    # 열별 (값 리스트, 코드 array('i')) 리스트 (코드 -1 = None, 표를 열 단위로 저장할 때)
+    def column_data(self):
+        return list(zip(self._values, self._codes))
+
+    # column_data()와 같은 형식의 열별 (값 리스트, 코드)로 표를 만듦
+    @classmethod
+    def from_column_data(cls, columns, column_data):
+        table = cls(columns)
+        for column_index, (values, codes) in enumerate(column_data):
+            table._values[column_index] = list(values)
+            table._lookups[column_index] = {value: code for code, value in enumerate(values)}
+            table._codes[column_index] = array('i', codes)
+        return table
+
+    # 행을 columns 순서의 tuple로 하나씩 생성 (None = 항목 없음)
+    def iter_rows(self):
+        columns = [values + [None] for values in self._values]
+        for codes in zip(*self._codes):
+            yield tuple(column[code] for column, code in zip(columns, codes))
+
+    # 행을 dict로 하나씩 생성 (항목 없는 키는 제외)
+    def iter_records(self):
+        for row in self.iter_rows():
+            yield {column: value for column, value in zip(self.columns, row) if value is not None}
+
+    # DataFrame으로 변환: categorical_columns(None이면 전체)는 Categorical, 나머지는 object 열 (여기서 numpy/pandas import)
+    # Categorical의 범주는 값 순으로 정렬해 두어 groupby/정렬 결과가 문자열 열과 같게 함
+    def to_dataframe(self, categorical_columns=None):
+        import numpy as np
+        import pandas as pd
+        data = {}
+        for column, codes, values in zip(self.columns, self._codes, self._values):
+            codes = np.frombuffer(codes, dtype=np.int32) if len(codes) else np.empty(0, dtype=np.int32)
+            if categorical_columns is None or column in categorical_columns:
+                order = sorted(range(len(values)), key=values.__getitem__)
+                remap = np.empty(len(values) + 1, dtype=np.int32)
+                remap[order] = np.arange(len(values), dtype=np.int32)
+                remap[-1] = -1
+                data[column] = pd.Categorical.from_codes(remap[codes], categories=[values[i] for i in order])
+            else:
+                lookup = np.empty(len(values) + 1, dtype=object)
+                lookup[:-1] = values
+                lookup[-1] = np.nan
+                data[column] = lookup[codes]
+        return pd.DataFrame(data, columns=self.columns)
+
+# 인코딩 판별에 쓰는 앞부분 크기와 증분 디코딩 단위
+_ENCODING_SAMPLE_SIZE = 64 * 1024
+_DECODE_CHUNK_SIZE = 1024 * 1024
+
+# 파일 앞부분(bytes-like)으로 인코딩 판별
+# - UTF-8 BOM이 있으면 'utf-8-sig', ASCII가 아닌 글자가 UTF-8로 올바르게 디코딩되면 'utf-8'
+# - 그 외(ASCII만 있는 경우 포함)는 연구포털 기본 저장 형식인 'cp949'
+def detect_encoding(sample):
+    sample = bytes(sample[:_ENCODING_SAMPLE_SIZE])
+    if sample.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+    if sample.isascii():
+        return 'cp949'
+    try:
+        # 앞부분만 잘라 왔으므로 끝에서 잘린 멀티바이트 문자는 허용 (final=False)
+        codecs.getincrementaldecoder('utf-8')().decode(sample, final=False)
+    except UnicodeDecodeError:
+        return 'cp949'
+    return 'utf-8'
+
+# bytes 조각들을 차례로 디코딩한 텍스트 조각 생성 (줄바꿈 '\r\n', '\r'은 '\n'으로 변환)
+# encoding이 None이면 첫 조각으로 판별
+def _decode_chunks(chunks, encoding):
+    decoder = None
+    for chunk in chunks:
+        if decoder is None:
+            if encoding is None:
+                encoding = detect_encoding(chunk)
+            decoder = io.IncrementalNewlineDecoder(codecs.getincrementaldecoder(encoding)(), True)
+        yield decoder.decode(chunk)
+    if decoder is not None:
+        yield decoder.decode(b'', final=True)
+
+# 텍스트 조각들 -> 줄 단위 (조각 경계에 걸친 줄은 이어 붙임, 줄 끝 '\n'은 제외)
+def _split_lines(text_chunks):
+    carry = ''
+    for text in text_chunks:
+        lines = (carry + text).split('\n')
+        carry = lines.pop()
+        yield from lines
+    if carry:
+        yield carry
+
+# bytes-like 버퍼/mmap을 chunk_size 단위로 나눔 (memoryview 조각은 복사 없이 원본을 참조)
+def _iter_buffer_chunks(buffer, chunk_size):
+    for start in range(0, len(buffer), chunk_size):
+        yield buffer[start:start + chunk_size]
+
+# 파일 객체를 chunk_size 단위로 읽음
+def _iter_file_chunks(f, chunk_size):
+    return iter(lambda: f.read(chunk_size), b'')
+
+# 로컬 파일을 chunk_size 단위로 읽어 줄 단위로 디코딩
+# (mmap은 읽는 중에 다른 사람이 파일을 덮어써 줄어들면 SIGBUS로 프로세스가 죽으므로 쓰지 않음)
+def _iter_file_lines(txt_path, encoding, chunk_size):
+    with open(txt_path, 'rb') as f:
+        yield from _split_lines(_decode_chunks(_iter_file_chunks(f, chunk_size), encoding))
+
+# 여러 형태의 입력을 줄 단위 텍스트로 변환
+# - 파일 경로(str, PathLike): 조각 단위로 읽음
+# - bytes, bytearray, memoryview, mmap: 임시 파일 없이 메모리에서 바로 조각 단위로 디코딩
+# - 파일 객체: 바이너리 모드면 조각 단위로 읽어 디코딩, 텍스트 모드면 그대로 사용
+# - encoding이 None이면 앞부분으로 cp949/UTF-8 판별 (텍스트 모드 파일 객체에는 적용 안 됨)
+def iter_source_lines(source, encoding=None, chunk_size=_DECODE_CHUNK_SIZE):
+    if isinstance(source, (str, os.PathLike)):
+        return _iter_file_lines(source, encoding, chunk_size)
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        chunks = _iter_buffer_chunks(memoryview(source).cast('B'), chunk_size)
+        return _split_lines(_decode_chunks(chunks, encoding))
+    if isinstance(source, mmap.mmap):
+        return _split_lines(_decode_chunks(_iter_buffer_chunks(source, chunk_size), encoding))
+    first = source.read(chunk_size)
+    rest = iter(lambda: source.read(chunk_size), first[:0])
+    if isinstance(first, str):
+        return _split_lines(itertools.chain([first], rest))
+    return _split_lines(_decode_chunks(itertools.chain([first] if first else [], rest), encoding))
+
+# 참여확인서 블록 구분 표식
+_CERTIFICATE_MARKER = '연구과제 참여확인서'
+_PROJECT_SECTION = '■ 과제정보'
+_RESEARCHER_SECTION = '■ 연구원정보'
+
+# 줄 단위 텍스트를 참여확인서 블록으로 나눔
+# - 블록: '연구과제 참여확인서' 표식부터 다음 표식 앞까지 (첫 블록은 첫 표식 앞부분)
+# - 줄 중간의 표식에서도 나누며, 블록을 이어 붙이면 원래 텍스트와 같음
+# 생성값: 블록의 줄(조각) 리스트
+def iter_certificate_blocks(lines):
+    marker = _CERTIFICATE_MARKER
+    pieces = []
+    for line in lines:
+        start = 0
+        found = line.find(marker)
+        while found >= 0:
+            if found > start:
+                pieces.append(line[start:found])
+            yield pieces
+            pieces = []
+            start = found
+            found = line.find(marker, found + len(marker))
+        pieces.append(line[start:] if start else line)
+    yield pieces
+
+# 참여확인서 블록의 중복 판별 키 (과제정보가 없어 파싱 결과가 없는 블록은 None)
+# - 파서가 읽는 부분('■ 연구원정보' 다음 '-- 이하 여백 --'/출력 날짜 앞까지)만 해시하므로
+#   출력 날짜만 다른 같은 참여확인서도 같은 키가 된다
+# - 파서는 줄 단위로 읽으므로 줄 경계도 키에 포함 (빈 줄 하나만 달라도 파싱 결과가 다를 수 있음)
+def certificate_block_key(pieces):
+    text = '\n'.join(pieces)
+    info_start = text.find(_PROJECT_SECTION)
+    if info_start < 0:
+        return None
+    researcher_start = text.find(_RESEARCHER_SECTION, info_start + len(_PROJECT_SECTION))
+    if researcher_start >= 0:
+        end = _STATE_PATTERNS[_IN_RESEARCHER].search(text, researcher_start + len(_RESEARCHER_SECTION))
+        if end is not None:
+            text = text[:end.start()]
+    return hashlib.sha256(text.encode('utf-8')).digest()
+
+# 참여확인서 블록 단위로 줄을 그대로 넘기며 블록 키와 블록 번호를 기록하는 줄 필터
+# - block_keys: 블록 순서대로의 블록 키 (과제정보가 없는 블록은 None)
+# - block_no: 지금 내보내는 줄의 블록 번호 (파서가 만든 행이 어느 블록에서 나왔는지)
+class CertificateBlockTracker:
+    def __init__(self):
+        self.block_keys = []
+        self.block_no = None
+
+    def filter(self, lines):
+        for block_no, pieces in enumerate(iter_certificate_blocks(lines)):
+            self.block_keys.append(certificate_block_key(pieces))
+            self.block_no = block_no
+            yield from pieces
+
+# 입력 하나의 참여확인서 블록 키 리스트 (블록 순서대로, iter_certificate_blocks 기준)
+def certificate_block_keys(source, encoding=None):
+    return [certificate_block_key(pieces) for pieces in iter_certificate_blocks(iter_source_lines(source, encoding))]
+
+# 입력(파일 경로, bytes, memoryview, mmap, 파일 객체) 하나에서 과제정보/연구원정보를 열 단위 표로 추출
+# - block_tracker(CertificateBlockTracker)가 있으면 블록 키를 기록
+# - row_blocks((과제정보 블록 번호 배열, 연구원정보 블록 번호 배열))가 있으면 행마다 그 행이 나온 블록 번호를 추가
+#   (block_tracker가 있어야 함, 파서는 블록 안의 줄을 읽는 중에 행을 만들므로 block_tracker.block_no가 그 블록)
+# 반환: (과제정보 ColumnarTable(PROJECT_KEYS), 연구원정보 ColumnarTable(RESEARCHER_KEYS))
+def parse_txt_source_columnar(source, encoding=None, block_tracker=None, row_blocks=None):
+    project_table = ColumnarTable(PROJECT_KEYS)
+    researcher_table = ColumnarTable(RESEARCHER_KEYS)
+    lines = iter_source_lines(source, encoding)
+    if block_tracker is not None:
+        lines = block_tracker.filter(lines)
+    for kind, row in iter_txt_rows(lines):
+        if kind == PROJECT_RECORD:
+            project_table.append_record(row)
+        else:
+            researcher_table.append(row)
+        if row_blocks is not None:
+            row_blocks[kind != PROJECT_RECORD].append(block_tracker.block_no)
+    return project_table, researcher_table
+
+# 입력(파일 경로, bytes, memoryview, mmap, 파일 객체) 하나에서 과제정보/연구원정보 추출
+# 반환: (과제정보 리스트, 연구원정보 리스트)
+def parse_txt_source(source, encoding=None):
+    project_info_list = []
+    researcher_info_list = []
+    for kind, record in iter_txt_records(iter_source_lines(source, encoding)):
+        if kind == PROJECT_RECORD:
+            project_info_list.append(record)
+        else:
+            researcher_info_list.append(record)
+    return project_info_list, researcher_info_list
+
+# 텍스트 파일 하나에서 과제정보/연구원정보 추출 (조각 단위로 읽음)
+# 반환: (과제정보 리스트, 연구원정보 리스트)
+def parse_txt_file(txt_path, encoding=None):
+    return parse_txt_source(txt_path, encoding)
+
+# 파일 내용(bytes, memoryview 등)의 해시: 같은 내용의 파일인지 비교할 때 사용
+def content_hash(data):
+    return hashlib.sha256(data).hexdigest()
+
+# 입력 하나의 파싱 결과: 과제정보/연구원정보 ColumnarTable, 오류가 나면 error에 메시지가 들어가고 두 표는 비어 있다
+# (txt_path는 입력이 파일 경로일 때만 경로, 메모리 입력이면 None)
+# duplicate_blocks: 앞서 파싱한 참여확인서와 같아 건너뛴 블록 수
+# blocks: parse_txt_files(..., blocks=True)일 때만 BlockIndex (그 밖에는 None)
+ParseResult = collections.namedtuple('ParseResult', ['txt_path', 'project_table', 'researcher_table', 'error',
+                                                     'duplicate_blocks', 'blocks'], defaults=(0, None))
+
+# 입력 하나의 참여확인서 블록 정보 (중복 판별을 파싱 뒤로 미룰 때, 예: 파싱 결과 저장소)
+# - block_keys: 블록 순서대로의 블록 키 리스트 (certificate_block_keys와 같음)
+# - project_blocks/researcher_blocks: 과제정보/연구원정보 행마다 그 행이 나온 블록 번호 (array('i'))
+BlockIndex = collections.namedtuple('BlockIndex', ['block_keys', 'project_blocks', 'researcher_blocks'])
+
+# 작업자(프로세스/스레드)에서 실행: 예외를 결과로 바꿔 입력 하나의 오류가 전체를 멈추지 않게 함
+# - blocks=True면 블록 키와 행별 블록 번호를 ParseResult.blocks(BlockIndex)에 담음
+def _parse_txt_source_safe(source, encoding=None, blocks=False):
+    txt_path = source if isinstance(source, (str, os.PathLike)) else None
+    block_tracker = row_blocks = None
+    if blocks:
+        block_tracker = CertificateBlockTracker()
+        row_blocks = (array('i'), array('i'))
+    try:
+        project_table, researcher_table = parse_txt_source_columnar(source, encoding, block_tracker, row_blocks)
+    except Exception as e:
+        return ParseResult(txt_path, ColumnarTable(PROJECT_KEYS), ColumnarTable(RESEARCHER_KEYS), str(e))
+    block_index = BlockIndex(block_tracker.block_keys, *row_blocks) if blocks else None
+    return ParseResult(txt_path, project_table, researcher_table, None, 0, block_index)
+
+# 입력별 블록 키 리스트 -> 입력별 건너뛸 블록 번호 집합 (입력 순서상 처음 나온 블록만 남김)
+# (블록 키 리스트가 None인 입력은 건너뛸 블록도, 다른 입력에서 건너뛰게 할 블록도 없음)
+# - seen: 앞서 처리한 입력들의 블록 키 집합 (주면 그 집합에 이어서 판별하고 새 블록 키를 추가)
+def duplicate_block_numbers(block_keys_list, seen=None):
+    if seen is None:
+        seen = set()
+    skip_blocks_list = []
+    for block_keys in block_keys_list:
+        skip_blocks = set()
+        for block_no, key in enumerate(block_keys or ()):
+            if key is None:
+                continue
+            if key in seen:
+                skip_blocks.add(block_no)
+            else:
+                seen.add(key)
+        skip_blocks_list.append(skip_blocks)
+    return skip_blocks_list
+
+# 파싱 결과(blocks 포함)에서 앞 입력에 이미 나온 참여확인서 블록의 행을 뺀 결과
+# - seen: 앞 입력들의 블록 키 집합 (이 입력의 블록 키를 추가, 오류 난 입력은 추가하지 않음)
+def _drop_duplicate_blocks(result, seen):
+    if result.error is not None:
+        return result
+    skip_blocks, = duplicate_block_numbers([result.blocks.block_keys], seen)
+    if not skip_blocks:
+        return result
+    project_rows = [row for row, block_no in enumerate(result.blocks.project_blocks) if block_no not in skip_blocks]
+    researcher_rows = [row for row, block_no in enumerate(result.blocks.researcher_blocks)
+                       if block_no not in skip_blocks]
+    block_index = BlockIndex(result.blocks.block_keys,
+                             array('i', map(result.blocks.project_blocks.__getitem__, project_rows)),
+                             array('i', map(result.blocks.researcher_blocks.__getitem__, researcher_rows)))
+    return result._replace(project_table=result.project_table.take(project_rows),
+                           researcher_table=result.researcher_table.take(researcher_rows),
+                           duplicate_blocks=len(skip_blocks), blocks=block_index)
+
+# ParseResult들의 과제정보/연구원정보 표를 하나로 합침 (오류 난 결과는 건너뜀)
+# 반환: (과제정보 ColumnarTable, 연구원정보 ColumnarTable)
+def concat_parse_results(results):
+    project_table = ColumnarTable(PROJECT_KEYS)
+    researcher_table = ColumnarTable(RESEARCHER_KEYS)
+    for result in results:
+        if result.error is None:
+            project_table.extend(result.project_table)
+            researcher_table.extend(result.researcher_table)
+    return project_table, researcher_table
+
+# 여러 입력(파일 경로, bytes, memoryview 등)을 작업자 풀로 나누어 파싱
+# - workers: 작업자 수 (None이면 CPU 수, 1이면 현재 프로세스에서 순차 처리)
+# - executor: 'process'(CPU 병렬, 기본값), 'thread', 또는 이미 만든 작업자 풀(Executor)
+#   (작업자 풀을 넘기면 그 풀에 작업만 넣고 풀은 닫지 않음, 여러 호출이 한 풀을 나누어 쓸 때)
+# - encoding: None이면 입력마다 cp949/UTF-8 자동 판별
+# - dedup=True면 모든 입력에 걸쳐 같은 참여확인서 블록은 처음 나온 곳의 행만 남김
+#   (입력마다 한 번만 파싱하고 블록 번호로 중복 블록의 행을 뺌, ParseResult.duplicate_blocks에 뺀 블록 수)
+# - blocks=True면 입력마다 블록 키와 행별 블록 번호도 기록 (ParseResult.blocks, 중복 판별을 나중에 할 때)
+# 반환: 입력 순서와 같은 순서의 ParseResult 리스트
+def parse_txt_files(sources, workers=None, executor='process', encoding=None, dedup=False, blocks=False):
+    return list(iter_parse_txt_files(sources, workers, executor, encoding, dedup, blocks))
+
+# parse_txt_files와 같지만 ParseResult를 입력 순서대로 하나씩 돌려줌 (진행 상황 표시용)
+# - 중간에 제너레이터를 닫으면 아직 시작하지 않은 입력은 파싱하지 않고 작업자 풀을 정리
+def iter_parse_txt_files(sources, workers=None, executor='process', encoding=None, dedup=False, blocks=False):
+    results = _iter_parse_results(sources, workers, executor, encoding, blocks=dedup or blocks)
+    if not dedup:
+        yield from results
+        return
+    # 입력 순서대로 블록 키를 모아 가며 앞 입력에 이미 나온 블록의 행을 뺌 (순차/병렬 처리 모두 같은 방식)
+    seen = set()
+    with contextlib.closing(results):
+        for result in results:
+            result = _drop_duplicate_blocks(result, seen)
+            yield result if blocks else result._replace(blocks=None)
+
+# 입력마다 _parse_txt_source_safe를 실행해 ParseResult를 입력 순서대로 돌려줌 (iter_parse_txt_files 참고)
+def _iter_parse_results(sources, workers, executor, encoding, blocks):
+    sources = list(sources)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(sources)))
+    if workers == 1:
+        for source in sources:
+            yield _parse_txt_source_safe(source, encoding, blocks)
+        return
+    # 작업자 풀(multiprocessing 포함)은 병렬 처리할 때만 import
+    from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+    shared_pool = isinstance(executor, Executor)
+    if shared_pool:
+        pool = executor
+    elif executor == 'process':
+        pool = ProcessPoolExecutor(max_workers=workers)
+    elif executor == 'thread':
+        pool = ThreadPoolExecutor(max_workers=workers)
+    else:
+        raise ValueError(f"executor는 'process', 'thread' 또는 Executor여야 합니다: {executor}")
+    if isinstance(pool, ProcessPoolExecutor):
+        # memoryview, mmap은 다른 프로세스로 보낼 수 없으므로 bytes로 복사
+        sources = [bytes(source) if isinstance(source, (bytearray, memoryview, mmap.mmap)) else source
+                   for source in sources]
+    # 작은 파일이 수천 개일 때 프로세스 간 전달 비용을 줄이도록 여러 파일씩 묶어서 전달
+    # (ThreadPoolExecutor는 chunksize를 무시)
+    chunksize = max(1, len(sources) // (workers * 4))
+    try:
+        # 제너레이터를 중간에 닫으면 map이 아직 시작하지 않은 작업을 취소함
+        yield from pool.map(_parse_txt_source_safe, sources, itertools.repeat(encoding), itertools.repeat(blocks),
+                            chunksize=chunksize)
+    finally:
+        if not shared_pool:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+# dict 레코드 리스트면 ColumnarTable로 바꾸고, ColumnarTable이면 그대로 반환
+def as_columnar_table(records, columns):
+    if isinstance(records, ColumnarTable):
+        return records
+    table = ColumnarTable(columns)
+    for record in records:
+        table.append_record(record)
+    return table
+
+# 연구원정보 표의 열: 연구원정보 항목에 과제정보의 지원기관을 세 번째 열로 붙임
+RESEARCHER_TABLE_COLUMNS = RESEARCHER_KEYS[:2] + ['지원기관'] + RESEARCHER_KEYS[2:]
+
+# 과제정보 행 리스트 (PROJECT_KEYS 순서의 tuple, 같은 행은 처음 나온 것만, 항목 없음은 None)
+# all_project_info: ColumnarTable 또는 과제정보 dict 리스트
+def build_project_rows(all_project_info):
+    return list(dict.fromkeys(as_columnar_table(all_project_info, PROJECT_KEYS).iter_rows()))
+
+# 연구원정보 행 리스트 (RESEARCHER_TABLE_COLUMNS 순서의 tuple)
+# - 과제번호가 같은 과제정보의 지원기관을 붙임 (없으면 None, 지원기관이 여러 개면 지원기관마다 한 행)
+# all_researcher_info: ColumnarTable 또는 연구원정보 dict 리스트
+def build_researcher_rows(all_researcher_info, project_rows):
+    number_index = PROJECT_KEYS.index('과제번호')
+    agency_index = PROJECT_KEYS.index('지원기관')
+    agencies = {}
+    for number, agency in dict.fromkeys((row[number_index], row[agency_index]) for row in project_rows):
+        agencies.setdefault(number, []).append(agency)
+    no_agency = [None]
+    researcher_rows = []
+    for row in as_columnar_table(all_researcher_info, RESEARCHER_KEYS).iter_rows():
+        for agency in agencies.get(row[0], no_agency):
+            researcher_rows.append(row[:2] + (agency,) + row[2:])
+    return researcher_rows
+
+# 'YYYY-MM-DD' -> date (형식이 다르면 None)
+def _parse_day(text):
+    try:
+        return datetime.datetime.strptime(text, '%Y-%m-%d').date()
+    except ValueError:
+        return None
+
+# 값 정렬 키: 빈 값(None)은 맨 뒤
+def _none_last(value):
+    return (value is None, '' if value is None else value)
+
+_ONE_DAY = datetime.timedelta(days=1)
+
+# 연구원정보 행의 참여기간을 병합 (참여기간 외 모든 열이 같은 행끼리)
+# - merge_participation_periods(DataFrame용)와 같은 결과를 pandas 없이 행 tuple로 계산
+# - 시작일 순으로 정렬했을 때 앞 기간 종료일 다음날 시작하는 기간을 하나로 합침
+# - 성명이 없는 행은 제외, 행 순서는 연구원 등장 순 > 그룹 키 순 > 시작일 순
+# 반환: 병합된 행 리스트 (열 구성은 입력과 동일)
+def merge_period_rows(rows, columns=RESEARCHER_TABLE_COLUMNS, period_column='참여기간'):
+    name_index = columns.index('성명')
+    period_index = columns.index(period_column)
+    rows = [row for row in rows if row[name_index] is not None]
+    name_rank = {}
+    entries = []
+    for row in rows:
+        rank = name_rank.setdefault(row[name_index], len(name_rank))
+        group = row[:period_index] + row[period_index + 1:]
+        period = str(row[period_index])
+        start, tilde, end = period.partition('~')
+        start, end = start.strip(), end.strip()
+        entries.append((rank, tuple(map(_none_last, group)), start, group, row, end, tilde == '~'))
+    # 안정 정렬이므로 시작일 문자열이 같으면 원래 순서 유지
+    entries.sort(key=lambda entry: entry[:3])
+    merged_rows = []
+    previous = None
+    for rank, _, start, group, row, end, has_range in entries:
+        start_day = _parse_day(start) if has_range else None
+        end_day = _parse_day(end) if has_range else None
+        if (previous is not None and has_range and previous['has_range'] and previous['group'] == group
+                and start_day is not None and previous['end_day'] is not None
+                and start_day - previous['end_day'] == _ONE_DAY):
+            previous['end'] = end
+            previous['end_day'] = end_day
+            continue
+        if previous is not None:
+            merged_rows.append(_merged_row(previous, period_index))
+        previous = {'row': row, 'group': group, 'start': start, 'end': end, 'end_day': end_day,
+                    'has_range': has_range}
+    if previous is not None:
+        merged_rows.append(_merged_row(previous, period_index))
+    return merged_rows
+
+# 병합 구간 하나 -> 첫 행의 참여기간을 '시작 ~ 마지막 행의 종료'로 바꾼 행
+def _merged_row(run, period_index):
+    row = run['row']
+    period = f"{run['start']} ~ {run['end']}" if run['has_range'] else row[period_index]
+    return row[:period_index] + (period,) + row[period_index + 1:]
@@ -0,0 +1,187 @@
+# 연구과제 참여확인서 파싱 결과 저장소 (SQLite)
+# - 파일 경로별로 크기/수정시각/내용 해시와 추출한 과제정보/연구원정보를 보관
+#   (기록마다 행을 두지 않고 파일마다 ColumnarTable의 열 데이터를 한 행에 보관, 불러올 때 기록별 디코딩이 없음)
+# - 다시 실행할 때 새 파일이나 바뀐 파일만 파싱하고, 사라진 파일의 기록은 삭제
+# - 여러 파일에 겹쳐 있는 같은 참여확인서는 파일마다 그대로 보관하고, 불러올 때(load_records) 한 번만 반영
+
+import os
+import json
+import hashlib
+import sqlite3
+from array import array
+
+from participation_core import (
+    parse_txt_files, duplicate_block_numbers, ColumnarTable, PROJECT_KEYS, RESEARCHER_KEYS
+)
+
+# 기본 저장소 파일 이름 (--store 경로를 생략하면 스크립트 폴더 안에 생성, 감시 모드는 participation_watch 참고)
+DEFAULT_STORE_NAME = '.participation_store.sqlite3'
+
+# 저장소 형식 버전 (PRAGMA user_version): 다르면 저장소를 비우고 새로 만듦 (모든 파일을 다시 파싱)
+_SCHEMA_VERSION = 3
+_TABLES = ('files', 'blocks', 'tables')
+# 예전 형식에만 있던 표 (저장소를 새로 만들 때 함께 삭제)
+_OLD_TABLES = ('projects', 'researchers')
+# blocks: 파일별 참여확인서 블록 키 (과제정보가 없는 블록은 NULL)
+# tables: 파일별 과제정보/연구원정보 표 (_encode_table 참고)
+#   *_blocks: 행마다 그 행이 나온 블록 번호 (array('i') 바이트)
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    content_hash TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS blocks (
+    path TEXT NOT NULL,
+    block_no INTEGER NOT NULL,
+    key BLOB,
+    PRIMARY KEY (path, block_no)
+);
+CREATE TABLE IF NOT EXISTS tables (
+    path TEXT PRIMARY KEY,
+    project_values TEXT NOT NULL,
+    project_codes BLOB NOT NULL,
+    project_blocks BLOB NOT NULL,
+    researcher_values TEXT NOT NULL,
+    researcher_codes BLOB NOT NULL,
+    researcher_blocks BLOB NOT NULL
+);
+'''
+
+# 저장소 열기 (없으면 생성, 형식이 예전 버전이면 비우고 새로 만듦)
+def open_store(db_path):
+    conn = sqlite3.connect(db_path)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    (version,) = conn.execute('PRAGMA user_version').fetchone()
+    if version != _SCHEMA_VERSION:
+        with conn:
+            for table in _TABLES + _OLD_TABLES:
+                conn.execute(f'DROP TABLE IF EXISTS {table}')
+            conn.execute(f'PRAGMA user_version = {_SCHEMA_VERSION}')
+    conn.executescript(_SCHEMA)
+    return conn
+
+# 파일 해시를 계산할 때 한 번에 읽는 크기
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+# 파일 내용 해시 (content_hash와 같은 값, 조각 단위로 읽어 파일 전체를 메모리에 올리지 않음)
+# (감시 폴더의 파일은 읽는 중에 덮어써질 수 있으므로 mmap을 쓰지 않음: 파일이 줄어들면 SIGBUS)
+def file_content_hash(txt_path):
+    digest = hashlib.sha256()
+    with open(txt_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+# ColumnarTable -> (값 JSON, 코드 BLOB)
+# - 값: 열마다 값 사전(처음 나온 순서의 값 리스트)을 모은 JSON 리스트
+# - 코드: 열마다 행 수만큼의 array('i') 바이트를 열 순서대로 이어 붙임 (-1 = 항목 없음)
+def _encode_table(table):
+    column_data = table.column_data()
+    values = json.dumps([values for values, _ in column_data], ensure_ascii=False)
+    codes = b''.join(codes.tobytes() for _, codes in column_data)
+    return values, codes
+
+# _encode_table의 반대: (값 JSON, 코드 BLOB) -> ColumnarTable(columns)
+def _decode_table(columns, values, codes):
+    values = json.loads(values)
+    codes = _decode_array(codes)
+    rows = len(codes) // len(columns)
+    return ColumnarTable.from_column_data(
+        columns, [(column_values, codes[index * rows:(index + 1) * rows])
+                  for index, column_values in enumerate(values)])
+
+def _decode_array(data):
+    numbers = array('i')
+    numbers.frombytes(data)
+    return numbers
+
+# 파일 하나의 기존 기록 삭제
+def _delete_file_records(conn, path):
+    for table in _TABLES:
+        conn.execute(f'DELETE FROM {table} WHERE path = ?', (path,))
+
+# 저장소를 txt_paths 목록과 맞춤
+# - 크기와 수정시각이 같으면 그대로 사용, 다르면 내용 해시를 비교해 바뀐 파일만 다시 파싱
+# - 목록에 없는 파일(삭제된 파일)의 기록은 제거
+# - 파싱 오류가 난 파일은 기록을 지워 다음 실행에서 다시 시도
+# 반환: {'parsed': [...], 'unchanged': [...], 'removed': [...], 'errors': [(경로, 오류 메시지)]}
+def sync_store(conn, txt_paths, workers=None, executor='process'):
+    txt_paths = [os.path.abspath(txt_path) for txt_path in txt_paths]
+    stored = {row[0]: row[1:] for row in conn.execute('SELECT path, size, mtime_ns, content_hash FROM files')}
+    summary = {'parsed': [], 'unchanged': [], 'removed': [], 'errors': []}
+    to_parse = []
+    with conn:
+        # 1. 변경 여부 확인
+        for txt_path in txt_paths:
+            stat = os.stat(txt_path)
+            previous = stored.get(txt_path)
+            if previous is not None and previous[:2] == (stat.st_size, stat.st_mtime_ns):
+                summary['unchanged'].append(txt_path)
+                continue
+            digest = file_content_hash(txt_path)
+            if previous is not None and previous[2] == digest:
+                # 내용은 같고 수정시각만 바뀜: 파일 정보만 갱신
+                conn.execute('UPDATE files SET size = ?, mtime_ns = ? WHERE path = ?',
+                             (stat.st_size, stat.st_mtime_ns, txt_path))
+                summary['unchanged'].append(txt_path)
+                continue
+            to_parse.append((txt_path, stat, digest))
+        # 2. 삭제된 파일의 기록 제거
+        current = set(txt_paths)
+        for path in stored:
+            if path not in current:
+                _delete_file_records(conn, path)
+                summary['removed'].append(path)
+        # 3. 새 파일/바뀐 파일만 파싱해 기록 교체 (중복 참여확인서 판별용 블록 키와 기록별 블록 번호도 보관)
+        results = parse_txt_files([txt_path for txt_path, _, _ in to_parse], workers=workers, executor=executor,
+                                  blocks=True)
+        for (txt_path, stat, digest), result in zip(to_parse, results):
+            _delete_file_records(conn, txt_path)
+            if result.error is not None:
+                summary['errors'].append((txt_path, result.error))
+                continue
+            conn.execute('INSERT INTO files (path, size, mtime_ns, content_hash) VALUES (?, ?, ?, ?)',
+                         (txt_path, stat.st_size, stat.st_mtime_ns, digest))
+            conn.executemany('INSERT INTO blocks (path, block_no, key) VALUES (?, ?, ?)',
+                             ((txt_path, block_no, key) for block_no, key in enumerate(result.blocks.block_keys)))
+            conn.execute('INSERT INTO tables (path, project_values, project_codes, project_blocks, researcher_values, '
+                         'researcher_codes, researcher_blocks) VALUES (?, ?, ?, ?, ?, ?, ?)',
+                         (txt_path, *_encode_table(result.project_table), result.blocks.project_blocks.tobytes(),
+                          *_encode_table(result.researcher_table), result.blocks.researcher_blocks.tobytes()))
+            summary['parsed'].append(txt_path)
+    return summary
+
+# 파일 경로 순으로 봤을 때 앞 파일에 이미 있는 참여확인서 블록 {경로: 블록 번호 집합} (건너뛸 블록이 있는 파일만)
+def _duplicate_blocks(conn):
+    paths, block_keys_list = [], []
+    for path, key in conn.execute('SELECT path, key FROM blocks ORDER BY path, block_no'):
+        if not paths or paths[-1] != path:
+            paths.append(path)
+            block_keys_list.append([])
+        block_keys_list[-1].append(key)
+    return {path: skip_blocks for path, skip_blocks in zip(paths, duplicate_block_numbers(block_keys_list))
+            if skip_blocks}
+
+# 저장소의 전체 기록 (파일 경로 순, 파일 안에서는 원래 순서)
+# - dedup=True면 여러 파일에 겹쳐 있는 같은 참여확인서는 경로 순으로 처음 나온 파일의 것만 반영
+#   (저장소 없이 parse_txt_files(..., dedup=True)로 파싱한 결과와 같음)
+# 반환: (과제정보 ColumnarTable, 연구원정보 ColumnarTable, 건너뛴 중복 블록 수)
+def load_records(conn, dedup=True):
+    duplicates = _duplicate_blocks(conn) if dedup else {}
+    project_table = ColumnarTable(PROJECT_KEYS)
+    researcher_table = ColumnarTable(RESEARCHER_KEYS)
+    query = ('SELECT path, project_values, project_codes, project_blocks, researcher_values, researcher_codes, '
+             'researcher_blocks FROM tables ORDER BY path')
+    for path, *data in conn.execute(query):
+        skip_blocks = duplicates.get(path)
+        for table, columns, (values, codes, blocks) in ((project_table, PROJECT_KEYS, data[:3]),
+                                                        (researcher_table, RESEARCHER_KEYS, data[3:])):
+            file_table = _decode_table(columns, values, codes)
+            if skip_blocks:
+                file_table = file_table.take([row for row, block_no in enumerate(_decode_array(blocks))
+                                              if block_no not in skip_blocks])
+            table.extend(file_table)
+    return project_table, researcher_table, sum(map(len, duplicates.values()))
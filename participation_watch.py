@@ -0,0 +1,161 @@
+# 입력 폴더 감시 모드 (공유 폴더에 txt 파일을 넣으면 통합 결과 파일을 자동으로 갱신)
+# - poll_interval초마다 폴더의 txt 파일 목록/크기/수정시각만 확인 (파일 내용은 읽지 않음)
+# - 변화가 생기면 debounce초 동안 더 바뀌지 않을 때까지 기다린 뒤 한 번에 반영
+#   (파일 여러 개를 연달아 복사해도 재생성은 한 번, 계속 바뀌어도 max_wait초가 지나면 반영)
+# - 파싱 결과 저장소(participation_store)로 새 파일/바뀐 파일만 다시 파싱
+#   (저장소는 이 컴퓨터의 상태 폴더에 둠: SQLite WAL 모드는 네트워크 공유 폴더에서 동작하지 않음)
+# - 결과 파일은 같은 폴더의 임시 폴더에 다 쓴 뒤 os.replace로 교체 (읽는 쪽에서 쓰다 만 파일을 보지 않음)
+# - 작은 VM용: 작업자 수 기본값 1, 파싱 결과는 저장소에 두고 재생성할 때만 메모리에 올림
+
+import os
+import sys
+import time
+import hashlib
+import tempfile
+
+from project_participation_excel import save_merged_to_excel, save_merged_tables, PipelineProfiler
+from participation_store import open_store, sync_store, load_records
+
+# 결과 파일 이름 (실행 시각을 붙이지 않고 같은 이름을 계속 교체)
+WATCH_OUTPUT_NAME = '연구과제_참여이력_통합'
+# 재생성에 실패했을 때 다시 시도하기까지 기다리는 시간(초)
+WATCH_RETRY_INTERVAL = 60.0
+
+# 감시 모드 저장소를 두는 로컬 상태 폴더
+# - Windows: %LOCALAPPDATA%\project-participation
+# - 그 밖: $XDG_STATE_HOME/project-participation (기본값 ~/.local/state/project-participation)
+def watch_state_dir():
+    if sys.platform == 'win32' and os.environ.get('LOCALAPPDATA'):
+        base_dir = os.environ['LOCALAPPDATA']
+    else:
+        base_dir = os.environ.get('XDG_STATE_HOME') or os.path.join(os.path.expanduser('~'), '.local', 'state')
+    return os.path.join(base_dir, 'project-participation')
+
+# input_dir을 감시할 때의 기본 저장소 경로 (폴더 이름 + 절대 경로 해시, 감시 폴더마다 따로)
+def default_watch_store_path(input_dir):
+    input_dir = os.path.abspath(input_dir)
+    digest = hashlib.sha256(input_dir.encode('utf-8')).hexdigest()[:12]
+    return os.path.join(watch_state_dir(), f'{os.path.basename(input_dir) or "root"}_{digest}.sqlite3')
+
+# 폴더의 txt 파일 상태 {경로: (크기, 수정시각)}
+# - '.'이나 '~'로 시작하는 파일(복사 중인 임시 파일, 숨김 파일)은 제외
+def snapshot_txt_files(directory):
+    snapshot = {}
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if not entry.name.lower().endswith('.txt') or entry.name.startswith(('.', '~')):
+                continue
+            try:
+                if not entry.is_file():
+                    continue
+                stat = entry.stat()
+            except FileNotFoundError:
+                # 확인하는 사이에 지워진 파일
+                continue
+            snapshot[entry.path] = (stat.st_size, stat.st_mtime_ns)
+    return snapshot
+
+# snapshot 이후 변화가 debounce초 동안 없을 때까지 기다림 (처음부터 max_wait초가 지나면 그대로 진행)
+# 반환: 마지막으로 확인한 폴더 상태
+def wait_until_settled(directory, snapshot, debounce, max_wait, poll_interval):
+    started = last_change = time.monotonic()
+    while True:
+        now = time.monotonic()
+        remaining = min(last_change + debounce, started + max_wait) - now
+        if remaining <= 0:
+            return snapshot
+        time.sleep(min(remaining, poll_interval))
+        current = snapshot_txt_files(directory)
+        if current != snapshot:
+            snapshot = current
+            last_change = time.monotonic()
+
+# 저장소의 전체 기록으로 결과 파일을 다시 만들어 output_dir의 파일과 교체
+# 반환: 교체한 결과 파일 경로 리스트
+def write_outputs_atomically(all_project_info, all_researcher_info, output_dir, fmt='xlsx', concurrency=False,
+                             profiler=None):
+    # os.replace가 원자적으로 동작하도록 임시 폴더를 결과 폴더 안에 만듦
+    with tempfile.TemporaryDirectory(prefix='.watch-', dir=output_dir) as work_dir:
+        output_prefix = os.path.join(work_dir, WATCH_OUTPUT_NAME)
+        if fmt == 'xlsx':
+            written_paths = [output_prefix + '.xlsx']
+            save_merged_to_excel(all_project_info, all_researcher_info, written_paths[0], profiler=profiler,
+                                 concurrency=concurrency)
+        else:
+            written_paths = save_merged_tables(all_project_info, all_researcher_info, output_prefix, fmt,
+                                               profiler=profiler, concurrency=concurrency)
+        output_paths = []
+        for written_path in written_paths:
+            output_path = os.path.join(output_dir, os.path.basename(written_path))
+            os.replace(written_path, output_path)
+            output_paths.append(output_path)
+    return output_paths
+
+# 저장소를 txt_paths와 맞추고, 바뀐 것이 있으면(force=True면 항상) 결과 파일 재생성
+# (파싱 오류가 난 파일도 저장소에서 기록이 지워졌으므로 재생성)
+# 반환: 교체한 결과 파일 경로 리스트 (재생성하지 않았으면 빈 리스트)
+# - dedup=True면 여러 파일에 겹쳐 있는 같은 참여확인서는 한 번만 반영
+def rebuild(conn, txt_paths, output_dir, fmt='xlsx', workers=1, executor='process', concurrency=False,
+            force=False, profile=False, dedup=True):
+    profiler = PipelineProfiler() if profile else None
+    summary = sync_store(conn, txt_paths, workers=workers, executor=executor)
+    for txt_path, error in summary['errors']:
+        print(f"파일 '{os.path.basename(txt_path)}' 처리 중 오류: {error}")
+    print(f"저장소 갱신: 새로 파싱 {len(summary['parsed'])}개, 변경 없음 {len(summary['unchanged'])}개, "
+          f"삭제 {len(summary['removed'])}개")
+    if not (force or summary['parsed'] or summary['removed'] or summary['errors']):
+        return []
+    all_project_info, all_researcher_info, duplicate_blocks = load_records(conn, dedup)
+    if duplicate_blocks:
+        print(f"중복 참여확인서 {duplicate_blocks}건은 한 번만 반영했습니다.")
+    output_paths = write_outputs_atomically(all_project_info, all_researcher_info, output_dir, fmt, concurrency,
+                                            profiler)
+    del all_project_info, all_researcher_info
+    print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} 결과 갱신: "
+          f"{', '.join(os.path.basename(path) for path in output_paths)}")
+    if profiler is not None:
+        print(profiler.format_report())
+    return output_paths
+
+# input_dir을 감시하며 결과 파일을 계속 갱신 (Ctrl+C/KeyboardInterrupt로 종료)
+# - output_dir: 결과 파일 폴더 (기본값: input_dir)
+# - store_path: 파싱 결과 저장소 경로 (기본값: default_watch_store_path(input_dir), 로컬 상태 폴더)
+# - dedup=True면 여러 파일에 겹쳐 있는 같은 참여확인서는 한 번만 반영
+# - 시작할 때 한 번 결과 파일을 만든 뒤, 이후에는 txt 파일이 추가/변경/삭제될 때만 재생성
+def watch_folder(input_dir, output_dir=None, fmt='xlsx', store_path=None, workers=1, executor='process',
+                 poll_interval=5.0, debounce=2.0, max_wait=60.0, concurrency=False, dedup=True, profile=False):
+    input_dir = os.path.abspath(input_dir)
+    output_dir = os.path.abspath(output_dir or input_dir)
+    os.makedirs(output_dir, exist_ok=True)
+    if store_path is None:
+        store_path = default_watch_store_path(input_dir)
+        os.makedirs(os.path.dirname(store_path), exist_ok=True)
+    print(f"폴더 감시 시작: {input_dir} (확인 간격 {poll_interval:g}초, 대기 {debounce:g}초, "
+          f"결과 폴더 {output_dir}, 저장소 {store_path})")
+    conn = open_store(store_path)
+    try:
+        snapshot = snapshot_txt_files(input_dir)
+        pending, force = True, True
+        next_attempt = time.monotonic()
+        while True:
+            if pending and time.monotonic() >= next_attempt:
+                snapshot = wait_until_settled(input_dir, snapshot, debounce, max_wait, poll_interval)
+                try:
+                    rebuild(conn, sorted(snapshot), output_dir, fmt, workers, executor, concurrency, force, profile,
+                            dedup)
+                    pending, force = False, False
+                except Exception as e:
+                    # 결과 파일을 다른 프로그램이 열고 있는 경우 등: 감시는 계속하고 나중에 다시 시도
+                    # (저장소는 이미 갱신됐을 수 있으므로 다음 시도에서는 변화가 없어도 재생성)
+                    print(f"결과 갱신 실패 ({WATCH_RETRY_INTERVAL:g}초 후 다시 시도): {e}")
+                    force = True
+                    next_attempt = time.monotonic() + WATCH_RETRY_INTERVAL
+            time.sleep(poll_interval)
+            current = snapshot_txt_files(input_dir)
+            if current != snapshot:
+                snapshot = current
+                pending = True
+    except KeyboardInterrupt:
+        print("폴더 감시 종료")
+    finally:
+        conn.close()
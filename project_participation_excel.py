@@ -2,146 +2,751 @@
 #입력자료: 연구포털에서 연구과제 일괄출력(조회) 후 .txt 파일로 저장
 #출력자료: 연구과제 참여이력 통합.xlsx
 
-import pandas as pd
 import re
 import os
+import io
+import csv
+import json
 import datetime
+import argparse
+import collections
+import zipfile
+import heapq
+import contextlib
+import importlib
+import time
+import threading
+import tracemalloc
+import cProfile
 
-# 텍스트 파일 하나에서 과제정보/연구원정보 추출
-# 반환: (과제정보 리스트, 연구원정보 리스트)
-def parse_txt_file(txt_path):
-    with open(txt_path, encoding='cp949') as f:
-        content = f.read()
-    # 1. 과제별로 분리
-    projects = [p for p in content.split('연구과제 참여확인서') if p.strip()]
-    project_info_list = []
-    researcher_info_list = []
-    for project in projects:
-        # 2. 과제정보, 연구원정보 블록 추출
-        info_block = re.search(r'■ 과제정보(.*?)■ 연구원정보', project, re.DOTALL)
-        researcher_block = re.search(r'■ 연구원정보(.*?)(?:-- 이하 여백 --|202\d{1,4}년|\Z)', project, re.DOTALL)
-        if not info_block or not researcher_block:
-            continue
-        info_lines = info_block.group(1).strip().split('\n')
-        researcher_lines = researcher_block.group(1).strip().split('\n')
-        # 3. 과제정보 추출
-        info_dict = {}
-        for line in info_lines:
-            for key in ['과제번호', '연구기간', '과 제 명', '연구책임자', '지원기관', '지원사업', '소속연구소', '관리부서', '협약연구비', '공동연구원수', '연구보조원수']:
-                if key in line:
-                    parts = line.split('\t')
-                    for i, part in enumerate(parts):
-                        if part.strip() == key and i+1 < len(parts):
-                            info_dict[key] = parts[i+1].strip()
-        project_number = info_dict.get('과제번호', '')
-        project_name = info_dict.get('과 제 명', '')
-        # 과제정보 리스트에 추가
-        if project_number:
-            project_info_list.append(info_dict)
-        # 4. 연구원정보 추출
-        if len(researcher_lines) < 3:
-            continue
-        name_line = researcher_lines[0]
-        name = re.search(r'성명:\s*([^\t]+)', name_line)
-        jumin = re.search(r'주민번호:\s*([^\t]+)', name_line)
-        name = name.group(1).strip() if name else ''
-        jumin = jumin.group(1).strip() if jumin else ''
-        for line in researcher_lines[2:]:
-            if not line.strip():
-                continue
-            parts = line.strip().split('\t')
-            if len(parts) < 4:
-                continue
-            researcher_dict = {
-                '과제번호': project_number,
-                '과 제 명': project_name,
-                '성명': name,
-                '주민번호': jumin,
-                '연구원구분': parts[0].strip(),
-                '과정구분': parts[1].strip(),
-                '소속': parts[2].strip(),
-                '참여기간': parts[3].strip()
-            }
-            researcher_info_list.append(researcher_dict)
-    return project_info_list, researcher_info_list
+# 파싱/기간병합 핵심은 participation_core (표준 라이브러리만 사용)
+# - numpy/pandas/openpyxl은 DataFrame이나 엑셀 파일이 필요한 함수 안에서만 import
+from participation_core import (
+    PROJECT_KEYS, RESEARCHER_KEYS, ColumnarTable, concat_parse_results, parse_txt_files,
+    RESEARCHER_TABLE_COLUMNS, build_project_rows, build_researcher_rows, merge_period_rows
+)
 
-# 여러 txt 파일을 통합 처리하여 엑셀로 저장
-# - 과제정보는 중복 없이 하나의 시트
-# - 연구원정보/기간병합은 연구원별로 각각 시트 생성
-def save_merged_to_excel(all_project_info, all_researcher_info, output_path):
-    # 1. 과제정보 통합 및 중복 제거
-    project_columns = ['과제번호', '연구기간', '과 제 명', '연구책임자', '지원기관', '지원사업', '소속연구소', '관리부서', '협약연구비', '공동연구원수', '연구보조원수']
-    project_df = pd.DataFrame(all_project_info).drop_duplicates().reindex(columns=project_columns)
-    # 2. 연구원정보 통합
-    researcher_columns = ['과제번호', '과 제 명', '성명', '주민번호', '연구원구분', '과정구분', '소속', '참여기간']
-    researcher_df = pd.DataFrame(all_researcher_info).reindex(columns=researcher_columns)
-    # 2-1. 과제번호 기준으로 지원기관 정보 매핑
+# 참여기간 문자열 Series('YYYY-MM-DD ~ YYYY-MM-DD')를 나눔
+# 반환: (시작 문자열 Series, 종료 문자열 Series, '~' 포함 여부 배열, 시작일/종료일 datetime64[D] 배열(형식이 다르면 NaT))
+def _split_periods(periods):
+    import pandas as pd
+    parts = periods.str.partition('~')
+    starts = parts[0].str.strip()
+    ends = parts[2].str.strip()
+    has_range = (parts[1] == '~').to_numpy()
+    start_days = pd.to_datetime(starts, format='%Y-%m-%d', errors='coerce').to_numpy().astype('datetime64[D]')
+    end_days = pd.to_datetime(ends, format='%Y-%m-%d', errors='coerce').to_numpy().astype('datetime64[D]')
+    return starts, ends, has_range, start_days, end_days
+
+# 연구원정보 DataFrame의 참여기간을 병합 (참여기간 외 모든 열이 같은 행끼리)
+# - 시작일 순으로 정렬했을 때 앞 기간 종료일 다음날 시작하는 기간을 하나로 합침
+# - 참여기간 열은 한 번만 datetime64로 변환하고, 전체 그룹을 한 번의 정렬과 배열 비교로 처리
+# - 성명이 없는 행은 제외, 행 순서는 연구원 등장 순 > 그룹 키 순 > 시작일 순
+# 반환: 병합된 DataFrame (열 구성은 입력과 동일)
+def merge_participation_periods(researcher_df, period_column='참여기간'):
+    import numpy as np
+    import pandas as pd
+    df = researcher_df[researcher_df['성명'].notna()]
+    if df.empty:
+        return df.reset_index(drop=True)
+    group_cols = [col for col in df.columns if col != period_column]
+    group_ids = df.groupby(group_cols, dropna=False, sort=True, observed=True).ngroup().to_numpy()
+    name_rank = pd.factorize(df['성명'])[0]
+    # 1. 'YYYY-MM-DD ~ YYYY-MM-DD' -> 시작/종료 문자열과 날짜 배열
+    periods = df[period_column].astype(str)
+    starts, ends, has_range, start_days, end_days = _split_periods(periods)
+    # 2. (연구원 등장 순, 그룹, 시작일 문자열) 순으로 안정 정렬
+    start_codes = pd.factorize(starts, sort=True)[0]
+    order = np.lexsort((start_codes, group_ids, name_rank))
+    group_ids = group_ids[order]
+    start_days = start_days[order]
+    end_days = end_days[order]
+    has_range = has_range[order]
+    # 3. 같은 그룹에서 바로 앞 기간 종료일 + 1일에 시작하면 앞 구간에 이어 붙임
+    continues = np.zeros(len(order), dtype=bool)
+    continues[1:] = ((group_ids[1:] == group_ids[:-1])
+                     & has_range[1:] & has_range[:-1]
+                     & (start_days[1:] - end_days[:-1] == np.timedelta64(1, 'D')))
+    run_starts = np.flatnonzero(~continues)
+    run_ends = np.append(run_starts[1:], len(order)) - 1
+    # 4. 구간마다 첫 행을 대표로 두고 참여기간을 '시작 ~ 종료'로 다시 씀
+    first_rows = order[run_starts]
+    last_rows = order[run_ends]
+    merged_periods = np.where(
+        has_range[run_starts],
+        starts.to_numpy()[first_rows] + ' ~ ' + ends.to_numpy()[last_rows],
+        periods.to_numpy()[first_rows])
+    merged_df = df.iloc[first_rows].reset_index(drop=True)
+    merged_df[period_column] = merged_periods
+    return merged_df
+
+# 연구원별 참여 구간 색인
+# - researchers: 연구원(성명, 주민번호) DataFrame, 등장 순
+# - offsets: i번째 연구원의 구간은 [offsets[i], offsets[i + 1])
+# - starts/ends: 구간 시작일/종료일(양 끝 포함, 1970-01-01부터의 일수), 연구원 안에서 시작일 순
+# - projects: 구간의 과제번호
+ParticipationIntervals = collections.namedtuple(
+    'ParticipationIntervals', ['researchers', 'offsets', 'starts', 'ends', 'projects'])
+
+# 동시참여 분석 결과 표 이름 (시트/파일 이름)
+CONCURRENCY_TABLE_NAMES = ('동시참여_요약', '중복참여', '동시참여_추이')
+# 중복참여 표에 나열할 최대 과제 쌍 수 (엑셀 시트 최대 행 수 안쪽, 쌍 수 합계는 요약 표에 정확히 기록)
+MAX_OVERLAP_PAIRS = 1000000
+
+# 기간통합 DataFrame -> 연구원별 참여 구간 색인
+# - 같은 연구원의 같은 과제 기간은 겹치거나 이어지면 하나로 합침 (연구원구분/소속이 바뀐 기간을 두 번 세지 않음)
+# - 참여기간 형식이 다르거나 시작일이 종료일보다 늦은 행은 제외
+# - 정렬 몇 번과 배열 연산으로 만들므로 O(n log n)
+def build_participation_intervals(merged_df, period_column='참여기간'):
+    import numpy as np
+    import pandas as pd
+    df = merged_df[merged_df['성명'].notna()]
+    if not df.empty:
+        _, _, has_range, start_days, end_days = _split_periods(df[period_column].astype(str))
+        valid = has_range & ~np.isnat(start_days) & ~np.isnat(end_days) & (start_days <= end_days)
+        df = df[valid]
+    if df.empty:
+        empty_days = np.zeros(0, dtype=np.int64)
+        return ParticipationIntervals(df[['성명', '주민번호']].reset_index(drop=True).astype(object),
+                                      np.zeros(1, dtype=np.int64), empty_days, empty_days,
+                                      np.zeros(0, dtype=object))
+    researcher_ids = df.groupby(['성명', '주민번호'], sort=False, dropna=False, observed=True).ngroup().to_numpy()
+    researchers = df[['성명', '주민번호']].drop_duplicates().reset_index(drop=True).astype(object)
+    project_ids, project_values = pd.factorize(df['과제번호'].astype(object), use_na_sentinel=False)
+    starts = start_days[valid].astype(np.int64)
+    ends = end_days[valid].astype(np.int64)
+    # 1. (연구원, 과제, 시작일) 순으로 정렬한 뒤 앞 구간들의 최대 종료일 + 1일 안에 시작하면 같은 구간
+    order = np.lexsort((starts, project_ids, researcher_ids))
+    researcher_ids = researcher_ids[order]
+    project_ids = project_ids[order]
+    starts = starts[order]
+    ends = ends[order]
+    new_group = np.ones(len(order), dtype=bool)
+    new_group[1:] = (researcher_ids[1:] != researcher_ids[:-1]) | (project_ids[1:] != project_ids[:-1])
+    running_end = pd.Series(ends).groupby(np.cumsum(new_group)).cummax().to_numpy()
+    new_run = new_group.copy()
+    new_run[1:] |= starts[1:] > running_end[:-1] + 1
+    run_starts = np.flatnonzero(new_run)
+    run_ends = np.append(run_starts[1:], len(order)) - 1
+    researcher_ids = researcher_ids[run_starts]
+    project_ids = project_ids[run_starts]
+    starts = starts[run_starts]
+    ends = running_end[run_ends]
+    # 2. 연구원 안에서 시작일 순으로 다시 정렬하고 연구원별 구간 위치 계산
+    order = np.lexsort((ends, starts, researcher_ids))
+    offsets = np.zeros(len(researchers) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(researcher_ids, minlength=len(researchers)), out=offsets[1:])
+    return ParticipationIntervals(researchers, offsets, starts[order], ends[order],
+                                  np.asarray(project_values, dtype=object)[project_ids[order]])
+
+# 일수 배열 -> 'YYYY-MM-DD' 문자열 배열
+def _format_days(days):
+    import numpy as np
+    return np.datetime_as_string(np.asarray(days, dtype='datetime64[D]'), unit='D')
+
+# 연구원별 동시참여 과제 수 추이 (스위프 라인)
+# - 구간 시작일에 +1, 종료일 다음날에 -1 사건을 두고 (연구원, 날짜, 증감) 순으로 한 번 정렬해 누적합
+# - 연구원마다 사건의 합이 0이므로 전체 누적합이 연구원 경계에서 저절로 0으로 돌아감
+# 반환: 성명, 주민번호, 시작일, 종료일, 동시참여과제수 (과제 수가 바뀌는 구간마다 한 행, 참여가 없는 구간 제외)
+def concurrency_timeline(intervals):
+    import numpy as np
+    researcher_ids = np.repeat(np.arange(len(intervals.researchers)), np.diff(intervals.offsets))
+    event_researchers = np.concatenate([researcher_ids, researcher_ids])
+    event_days = np.concatenate([intervals.starts, intervals.ends + 1])
+    deltas = np.concatenate([np.ones(len(researcher_ids), dtype=np.int64),
+                             -np.ones(len(researcher_ids), dtype=np.int64)])
+    order = np.lexsort((deltas, event_days, event_researchers))
+    event_researchers = event_researchers[order]
+    event_days = event_days[order]
+    counts = np.cumsum(deltas[order])
+    # 같은 날의 사건은 마지막 사건의 누적값만 남기고, 앞 구간과 과제 수가 같으면 이어 붙임
+    last_of_day = np.ones(len(order), dtype=bool)
+    last_of_day[:-1] = (event_researchers[1:] != event_researchers[:-1]) | (event_days[1:] != event_days[:-1])
+    event_researchers = event_researchers[last_of_day]
+    event_days = event_days[last_of_day]
+    counts = counts[last_of_day]
+    changed = np.ones(len(counts), dtype=bool)
+    changed[1:] = (event_researchers[1:] != event_researchers[:-1]) | (counts[1:] != counts[:-1])
+    event_researchers = event_researchers[changed]
+    event_days = event_days[changed]
+    counts = counts[changed]
+    # 각 구간은 다음 변화 전날까지 (연구원의 마지막 사건은 항상 0이므로 제외됨)
+    segment_ends = np.append(event_days[1:], 0) - 1
+    active = counts > 0
+    timeline = intervals.researchers.iloc[event_researchers[active]].reset_index(drop=True)
+    timeline['시작일'] = _format_days(event_days[active])
+    timeline['종료일'] = _format_days(segment_ends[active])
+    timeline['동시참여과제수'] = counts[active]
+    return timeline
+
+# 연구원별로 기간이 겹치는 과제 쌍 (스위프 라인)
+# - 시작일 순으로 구간을 넣으면서 종료일 최소 힙에서 이미 끝난 구간을 빼고, 남은 구간과만 짝을 지음
+# - 모든 구간 쌍을 비교하지 않으므로 O(n log n + 겹치는 쌍의 수)
+# - 겹치는 쌍이 max_pairs개를 넘으면 앞의 max_pairs개만 (연구원 순)
+# 반환: 성명, 주민번호, 과제번호_1, 과제번호_2, 중복시작일, 중복종료일, 중복일수 (과제번호_1이 먼저 시작한 과제)
+def overlap_pairs(intervals, max_pairs=None):
+    import numpy as np
+    starts = intervals.starts.tolist()
+    ends = intervals.ends.tolist()
+    offsets = intervals.offsets.tolist()
+    remaining = max_pairs if max_pairs is not None else -1
+    pair_researchers, first, second, overlap_starts, overlap_ends = [], [], [], [], []
+    for researcher_id in range(len(intervals.researchers)):
+        active = []  # (종료일, 구간 위치) 최소 힙
+        for i in range(offsets[researcher_id], offsets[researcher_id + 1]):
+            start = starts[i]
+            while active and active[0][0] < start:
+                heapq.heappop(active)
+            for end, j in active:
+                if remaining == 0:
+                    break
+                remaining -= 1
+                pair_researchers.append(researcher_id)
+                first.append(j)
+                second.append(i)
+                overlap_starts.append(start)
+                overlap_ends.append(min(end, ends[i]))
+            if remaining == 0:
+                break
+            heapq.heappush(active, (ends[i], i))
+        if remaining == 0:
+            break
+    overlap_starts = np.array(overlap_starts, dtype=np.int64)
+    overlap_ends = np.array(overlap_ends, dtype=np.int64)
+    pairs = intervals.researchers.iloc[pair_researchers].reset_index(drop=True)
+    pairs['과제번호_1'] = intervals.projects[first]
+    pairs['과제번호_2'] = intervals.projects[second]
+    pairs['중복시작일'] = _format_days(overlap_starts)
+    pairs['중복종료일'] = _format_days(overlap_ends)
+    pairs['중복일수'] = overlap_ends - overlap_starts + 1
+    return pairs
+
+# 연구원별 겹치는 과제 쌍 수 (쌍을 만들지 않고 계산)
+# - 구간 i와 겹치는 앞선 구간 수 = 앞에서 시작한 구간 수 - i 시작 전에 끝난 구간 수 (정렬된 종료일에서 이진 탐색)
+def _count_overlap_pairs(intervals):
+    import numpy as np
+    counts = np.diff(intervals.offsets)
+    researcher_ids = np.repeat(np.arange(len(counts)), counts)
+    if not len(researcher_ids):
+        return np.zeros(len(counts), dtype=np.int64)
+    # (연구원, 날짜)를 정수 하나로 합쳐 전체를 한 번에 정렬/탐색
+    first_day = min(intervals.starts.min(), intervals.ends.min())
+    span = max(intervals.starts.max(), intervals.ends.max()) - first_day + 2
+    start_keys = researcher_ids * span + (intervals.starts - first_day)
+    end_keys = np.sort(researcher_ids * span + (intervals.ends - first_day))
+    started_before = np.arange(len(researcher_ids)) - intervals.offsets[researcher_ids]
+    ended_before = np.searchsorted(end_keys, start_keys, side='left') - intervals.offsets[researcher_ids]
+    return np.bincount(researcher_ids, weights=started_before - ended_before, minlength=len(counts)).astype(np.int64)
+
+# 연구원별 동시참여 요약: 참여과제수, 최대 동시참여과제수와 처음 그 수에 이른 구간, 중복참여 쌍 수
+def peak_concurrency(intervals, timeline):
+    summary = intervals.researchers.copy()
+    keys = ['성명', '주민번호']
+    summary['참여과제수'] = [len(set(intervals.projects[start:end]))
+                          for start, end in zip(intervals.offsets[:-1], intervals.offsets[1:])]
+    summary['중복참여쌍수'] = _count_overlap_pairs(intervals)
+    peaks = timeline.loc[timeline.groupby(keys, sort=False, dropna=False)['동시참여과제수'].idxmax()]
+    peaks = peaks.rename(columns={'동시참여과제수': '최대동시참여과제수',
+                                  '시작일': '최대동시참여시작일', '종료일': '최대동시참여종료일'})
+    summary = summary.merge(peaks, on=keys, how='left')
+    return summary[keys + ['참여과제수', '최대동시참여과제수', '최대동시참여시작일', '최대동시참여종료일', '중복참여쌍수']]
+
+# 기간통합 DataFrame으로 연구원별 동시참여 분석
+# 반환: {'동시참여_요약': 연구원별 요약, '중복참여': 겹치는 과제 쌍(최대 max_pairs개), '동시참여_추이': 동시참여 과제 수 추이}
+def analyze_concurrent_participation(merged_df, period_column='참여기간', max_pairs=MAX_OVERLAP_PAIRS):
+    intervals = build_participation_intervals(merged_df, period_column)
+    timeline = concurrency_timeline(intervals)
+    pairs = overlap_pairs(intervals, max_pairs)
+    summary = peak_concurrency(intervals, timeline)
+    return dict(zip(CONCURRENCY_TABLE_NAMES, (summary, pairs, timeline)))
+
+# tracemalloc은 프로세스 전체에 하나뿐이므로 메모리를 측정하는 단계는 한 번에 하나씩만 실행
+# (같은 스레드 안에서 단계를 겹쳐 여는 것은 허용)
+_MEMORY_TRACE_LOCK = threading.RLock()
+
+# 파이프라인 단계별 측정 기록 (실행 시간, 최대 메모리, 입력/출력 행 수, 처리 바이트)
+# - trace_memory=True면 tracemalloc으로 단계별 최대 메모리를 측정 (측정 중에는 처리가 느려짐)
+# - 메모리를 측정하는 단계는 _MEMORY_TRACE_LOCK으로 차례대로 실행 (다른 스레드의 측정 단계는 끝날 때까지 기다림)
+#   측정하지 않는 다른 스레드가 그동안 할당한 메모리는 함께 잡힐 수 있음
+# - 프로세스 풀에서 파싱한 경우 작업자 프로세스의 메모리는 포함되지 않음
+class PipelineProfiler:
+    def __init__(self, trace_memory=True):
+        self.trace_memory = trace_memory
+        self.stages = []
+
+    # 단계 하나 측정: with 블록 안에서 반환된 dict에 output_rows 등을 채워 넣음
+    @contextlib.contextmanager
+    def stage(self, name, input_rows=None, input_bytes=None):
+        record = {'stage': name, 'seconds': None, 'peak_bytes': None,
+                  'input_rows': input_rows, 'output_rows': None, 'input_bytes': input_bytes}
+        started_tracing = False
+        if self.trace_memory:
+            _MEMORY_TRACE_LOCK.acquire()
+            if tracemalloc.is_tracing():
+                tracemalloc.reset_peak()
+            else:
+                tracemalloc.start()
+                started_tracing = True
+            memory_before = tracemalloc.get_traced_memory()[0]
+        started = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record['seconds'] = time.perf_counter() - started
+            if self.trace_memory:
+                record['peak_bytes'] = tracemalloc.get_traced_memory()[1] - memory_before
+                # 이 단계가 시작한 추적만 멈춤
+                if started_tracing:
+                    tracemalloc.stop()
+                _MEMORY_TRACE_LOCK.release()
+            self.stages.append(record)
+
+    # 단계별 기록을 표 형태의 문자열로
+    def format_report(self):
+        lines = [f"{'단계':<20}{'시간(s)':>10}{'최대 메모리(MB)':>16}{'입력 행':>10}{'출력 행':>10}{'처리 바이트':>14}"]
+        for record in self.stages:
+            peak = f"{record['peak_bytes'] / 1024 / 1024:.1f}" if record['peak_bytes'] is not None else '-'
+            lines.append(f"{record['stage']:<20}{record['seconds']:>10.3f}{peak:>16}"
+                         f"{_format_count(record['input_rows']):>10}{_format_count(record['output_rows']):>10}"
+                         f"{_format_count(record['input_bytes']):>14}")
+        total = sum(record['seconds'] for record in self.stages)
+        lines.append(f"{'합계':<20}{total:>10.3f}")
+        return '\n'.join(lines)
+
+def _format_count(value):
+    return '-' if value is None else f'{value:,}'
+
+# profiler가 None이면 측정하지 않는 빈 단계 (호출하는 쪽 코드는 그대로 record에 값을 기록)
+def profile_stage(profiler, name, input_rows=None, input_bytes=None):
+    if profiler is None:
+        return contextlib.nullcontext({})
+    return profiler.stage(name, input_rows=input_rows, input_bytes=input_bytes)
+
+# 엑셀 시트 이름 규칙: 31자 이하, 아래 문자 사용 불가, 작은따옴표로 시작/끝 불가, 대소문자 무시하고 중복 불가
+_SHEET_NAME_MAX = 31
+_INVALID_SHEET_CHARS_RE = re.compile(r'[\[\]:*?/\\]')
+
+# 엑셀에서 쓸 수 있는 시트 이름 만들기
+# - 허용되지 않는 문자는 '_'로 바꾸고, suffix가 잘리지 않도록 이름 부분을 줄임
+# - used_names(소문자 집합)에 이미 있으면 ' (2)', ' (3)', ...을 붙이고 결과를 used_names에 추가
+def make_sheet_name(name, used_names, suffix=''):
+    base = _INVALID_SHEET_CHARS_RE.sub('_', str(name)).strip("'") or 'Sheet'
+    suffix = _INVALID_SHEET_CHARS_RE.sub('_', suffix)
+    sheet_name = base[:_SHEET_NAME_MAX - len(suffix)] + suffix
+    counter = 2
+    while sheet_name.lower() in used_names or sheet_name.lower() == 'history':
+        tag = f' ({counter})'
+        sheet_name = base[:_SHEET_NAME_MAX - len(suffix) - len(tag)] + tag + suffix
+        counter += 1
+    used_names.add(sheet_name.lower())
+    return sheet_name
+
+# DataFrame -> 시트에 기록할 object 배열 (NaN은 None = 빈 칸)
+def _sheet_rows(df):
+    return df.astype(object).where(df.notna(), None).to_numpy()
+
+# 쓰기 전용 시트에 머리글과 행(_sheet_rows 결과)을 한 줄씩 기록하고 시트를 닫음
+# (쓰기 전용 시트는 닫을 때까지 임시 파일을 열어 두므로, 저장할 때까지 두면 시트 수만큼 파일이 열려 있음)
+def _append_rows(worksheet, columns, rows):
+    worksheet.append(list(columns))
+    for row in rows:
+        worksheet.append(row.tolist())
+    worksheet.close()
+
+# 과제정보 시트 + 연구원별 원본/기간통합 시트를 쓰기 전용(스트리밍) 모드로 저장
+# - output: 파일 경로 또는 BytesIO 같은 파일 객체
+# - project_df가 None이면 과제정보 시트 생략, 연구원 시트 이름은 '성명', '성명'+merged_suffix
+# - extra_tables({시트 이름: DataFrame}, 예: 동시참여 분석)가 있으면 과제정보 다음 시트로 기록
+# - 연구원별 행은 성명 기준 groupby 한 번으로 나누고, 행은 시트에 바로 기록하므로
+#   연구원(시트)이 수천 명이어도 메모리 사용량이 일정하다
+# - 시트는 다 쓰는 대로 닫으므로 동시에 열려 있는 임시 파일은 하나뿐 (시트 수가 열린 파일 수 제한을 넘어도 됨)
+def write_participation_workbook(output, project_df, researcher_df, merged_df, merged_suffix='(통합)',
+                                 extra_tables=None):
+    from openpyxl import Workbook
+    workbook = Workbook(write_only=True)
+    used_names = set()
+    if project_df is not None:
+        worksheet = workbook.create_sheet(make_sheet_name('과제정보', used_names))
+        _append_rows(worksheet, project_df.columns, _sheet_rows(project_df))
+    for sheet_name, df in (extra_tables or {}).items():
+        worksheet = workbook.create_sheet(make_sheet_name(sheet_name, used_names))
+        _append_rows(worksheet, df.columns, _sheet_rows(df))
+    researcher_rows = _sheet_rows(researcher_df)
+    merged_rows = _sheet_rows(merged_df)
+    merged_groups = merged_df.groupby('성명', sort=False, observed=True).indices
+    for name, positions in researcher_df.groupby('성명', sort=False, observed=True).indices.items():
+        worksheet = workbook.create_sheet(make_sheet_name(name, used_names))
+        _append_rows(worksheet, researcher_df.columns, researcher_rows[positions])
+        worksheet = workbook.create_sheet(make_sheet_name(name, used_names, merged_suffix))
+        _append_rows(worksheet, merged_df.columns, merged_rows[merged_groups.get(name, [])])
+    workbook.save(output)
+
+# 내보내기 형식: xlsx는 연구원별 시트가 있는 통합 엑셀, 나머지는 표(과제정보/연구원정보/기간통합)마다 파일 하나
+EXPORT_FORMATS = ('xlsx', 'csv', 'jsonl', 'parquet')
+EXPORT_TABLE_NAMES = ('과제정보', '연구원정보', '기간통합')
+# 표 형식 내보내기에서 한 번에 변환해 기록하는 행 수
+_EXPORT_CHUNK_ROWS = 50000
+
+def _iter_row_chunks(df, chunk_rows):
+    for start in range(0, len(df), chunk_rows):
+        yield df.iloc[start:start + chunk_rows]
+
+# CSV (UTF-8 BOM을 붙여 엑셀에서 열어도 한글이 깨지지 않음)
+def _write_table_csv(f, df, chunk_rows):
+    text = io.TextIOWrapper(f, encoding='utf-8-sig', newline='', write_through=True)
+    try:
+        df.iloc[:0].to_csv(text, index=False)
+        for chunk in _iter_row_chunks(df, chunk_rows):
+            chunk.to_csv(text, index=False, header=False)
+    finally:
+        text.detach()
+
+# JSON Lines (한 줄에 행 하나, 빈 칸은 null)
+# - DataFrame.to_json은 '/'를 '\/'로 바꾸므로 쓰지 않고, 행 단위 저장(_write_rows_jsonl)과 같은 직렬화 사용
+def _write_table_jsonl(f, df, chunk_rows):
+    columns = [str(column) for column in df.columns]
+    for chunk in _iter_row_chunks(df, chunk_rows):
+        _write_rows_jsonl(f, columns, _sheet_rows(chunk))
+
+# Parquet (chunk_rows 행마다 row group 하나, Categorical 열은 사전 인코딩 그대로 기록)
+def _write_table_parquet(f, df, chunk_rows):
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError('parquet 형식으로 저장하려면 pyarrow가 필요합니다 (pip install pyarrow)') from e
+    schema = pyarrow.Schema.from_pandas(df, preserve_index=False)
+    with pyarrow.parquet.ParquetWriter(f, schema) as writer:
+        for chunk in _iter_row_chunks(df, chunk_rows):
+            writer.write_table(pyarrow.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+
+_TABLE_WRITERS = {
+    'csv': _write_table_csv,
+    'jsonl': _write_table_jsonl,
+    'parquet': _write_table_parquet,
+}
+
+# 행 tuple 리스트를 CSV/JSON Lines로 저장 (DataFrame 없이, 빈 값 None은 빈 칸/null)
+# - CSV는 _write_table_csv(DataFrame.to_csv)와 같은 형식
+# - JSON Lines는 _write_table_jsonl도 이 함수로 기록하므로 두 경로의 결과가 같음
+def _write_rows_csv(f, columns, rows):
+    text = io.TextIOWrapper(f, encoding='utf-8-sig', newline='', write_through=True)
+    try:
+        writer = csv.writer(text, lineterminator=os.linesep)
+        writer.writerow(columns)
+        writer.writerows(rows)
+    finally:
+        text.detach()
+
+def _write_rows_jsonl(f, columns, rows):
+    text = io.TextIOWrapper(f, encoding='utf-8', newline='\n', write_through=True)
+    try:
+        for row in rows:
+            text.write(json.dumps(dict(zip(columns, row)), ensure_ascii=False, separators=(',', ':')) + '\n')
+    finally:
+        text.detach()
+
+# pandas 없이 저장할 수 있는 형식
+_ROW_WRITERS = {
+    'csv': _write_rows_csv,
+    'jsonl': _write_rows_jsonl,
+}
+
+# 표 하나를 fmt('csv', 'jsonl', 'parquet') 형식으로 저장
+# - output: 파일 경로 또는 바이너리 파일 객체
+# - chunk_rows 행씩 변환해 바로 기록하므로 표 전체를 문자열로 만들지 않음
+def write_table(output, df, fmt, chunk_rows=_EXPORT_CHUNK_ROWS):
+    writer = _TABLE_WRITERS[fmt]
+    if isinstance(output, (str, os.PathLike)):
+        with open(output, 'wb') as f:
+            writer(f, df, chunk_rows)
+    else:
+        writer(output, df, chunk_rows)
+
+# 과제정보/연구원정보/기간통합 표 (project_df가 None이면 과제정보 제외)
+def participation_tables(project_df, researcher_df, merged_df):
+    tables = dict(zip(EXPORT_TABLE_NAMES, (project_df, researcher_df, merged_df)))
+    return {name: df for name, df in tables.items() if df is not None}
+
+# 여러 표를 '표이름.fmt' 파일로 묶은 zip 하나로 저장 (zip 항목에 바로 기록)
+def write_tables_archive(output, tables, fmt):
+    with zipfile.ZipFile(output, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for name, df in tables.items():
+            with archive.open(f'{name}.{fmt}', 'w') as f:
+                write_table(f, df, fmt)
+
+# 반복되는 값이 많아 Categorical로 둘 열
+_CATEGORICAL_PROJECT_COLUMNS = ['연구책임자', '지원기관', '지원사업', '소속연구소', '관리부서']
+_CATEGORICAL_RESEARCHER_COLUMNS = ['과제번호', '과 제 명', '성명', '주민번호', '연구원구분', '과정구분', '소속']
+
+# 과제정보 DataFrame (중복 제거, PROJECT_KEYS 열 순서)
+# all_project_info: ColumnarTable 또는 과제정보 dict 리스트
+def build_project_df(all_project_info):
+    import pandas as pd
+    if isinstance(all_project_info, ColumnarTable):
+        project_df = all_project_info.to_dataframe(_CATEGORICAL_PROJECT_COLUMNS)
+    else:
+        project_df = pd.DataFrame(all_project_info)
+    return project_df.drop_duplicates().reindex(columns=PROJECT_KEYS)
+
+# 연구원정보 DataFrame: 과제번호 기준으로 과제정보의 지원기관을 붙여 세 번째 열에 둠
+# all_researcher_info: ColumnarTable 또는 연구원정보 dict 리스트
+def build_researcher_df(all_researcher_info, project_df):
+    import pandas as pd
+    if isinstance(all_researcher_info, ColumnarTable):
+        researcher_df = all_researcher_info.to_dataframe(_CATEGORICAL_RESEARCHER_COLUMNS)
+    else:
+        researcher_df = pd.DataFrame(all_researcher_info).reindex(columns=RESEARCHER_KEYS)
+    project_number_is_categorical = isinstance(researcher_df['과제번호'].dtype, pd.CategoricalDtype)
     project_df_for_merge = project_df[['과제번호', '지원기관']].drop_duplicates()
     researcher_df = pd.merge(researcher_df, project_df_for_merge, on='과제번호', how='left')
-    # 지원기관을 세 번째 열로 이동
+    if project_number_is_categorical:
+        # 병합 키는 범주가 달라 문자열 열이 되므로 다시 Categorical로
+        researcher_df['과제번호'] = researcher_df['과제번호'].astype('category')
     cols = list(researcher_df.columns)
     cols.insert(2, cols.pop(cols.index('지원기관')))
-    researcher_df = researcher_df[cols]
-    # 3. 연구원별로 시트 분리
-    researcher_names = researcher_df['성명'].dropna().unique()
-    # 4. 참여기간 병합 함수
-    def parse_period(period):
-        start, end = period.split('~')
-        return start.strip(), end.strip()
-    def merge_periods(periods):
-        periods = sorted([parse_period(p) for p in periods], key=lambda x: x[0])
-        merged = []
-        for s, e in periods:
-            if not merged:
-                merged.append([s, e])
-            else:
-                last_s, last_e = merged[-1]
-                last_end = datetime.datetime.strptime(last_e, "%Y-%m-%d")
-                this_start = datetime.datetime.strptime(s, "%Y-%m-%d")
-                if (this_start - last_end).days == 1:
-                    merged[-1][1] = e
-                else:
-                    merged.append([s, e])
-        return ['{} ~ {}'.format(s, e) for s, e in merged]
-    # 5. 엑셀로 저장
-    with pd.ExcelWriter(output_path) as writer:
-        # 과제정보 시트
-        project_df.to_excel(writer, sheet_name='과제정보', index=False)
-        # 연구원별 시트 생성
-        for name in researcher_names:
-            r_df = researcher_df[researcher_df['성명'] == name].copy()
-            r_df.to_excel(writer, sheet_name=name, index=False)
-            # 기간 병합
-            group_cols = [col for col in r_df.columns if col != '참여기간']
-            merged_rows = []
-            for _, group in r_df.groupby(group_cols, dropna=False):
-                periods = group['참여기간'].tolist()
-                for merged_period in merge_periods(periods):
-                    row = group.iloc[0].to_dict()
-                    row['참여기간'] = merged_period
-                    merged_rows.append(row)
-            merged_researcher_df = pd.DataFrame(merged_rows).reindex(columns=r_df.columns)
-            merged_sheet_name = f"{name}(통합)"
-            merged_researcher_df.to_excel(writer, sheet_name=merged_sheet_name, index=False)
+    return researcher_df[cols]
+
+# 과제정보/연구원정보를 통합해 과제정보, 연구원정보, 기간병합 DataFrame 생성
+# - all_project_info/all_researcher_info: ColumnarTable 또는 dict 리스트
+# - profiler(PipelineProfiler)가 있으면 단계별로 측정
+# - on_table(표 이름, DataFrame)이 있으면 표가 하나 만들어질 때마다 호출 (과제정보부터, 중간 결과 표시용)
+# 반환: (project_df, researcher_df, merged_df)
+def build_participation_tables(all_project_info, all_researcher_info, profiler=None, on_table=None):
+    # 0. numpy/pandas import (처음 import하는 시간이 과제정보 단계에 섞이지 않도록 따로 측정)
+    with profile_stage(profiler, 'import_pandas'):
+        importlib.import_module('pandas')
+    # 1. 과제정보 통합 및 중복 제거
+    with profile_stage(profiler, 'build_project_df', input_rows=len(all_project_info)) as record:
+        project_df = build_project_df(all_project_info)
+        record['output_rows'] = len(project_df)
+    if on_table is not None:
+        on_table(EXPORT_TABLE_NAMES[0], project_df)
+    # 2. 연구원정보 통합 (과제번호 기준으로 지원기관 정보 매핑)
+    with profile_stage(profiler, 'merge_support_agency', input_rows=len(all_researcher_info)) as record:
+        researcher_df = build_researcher_df(all_researcher_info, project_df)
+        record['output_rows'] = len(researcher_df)
+    if on_table is not None:
+        on_table(EXPORT_TABLE_NAMES[1], researcher_df)
+    # 3. 참여기간 병합 (모든 연구원을 한 번에 처리)
+    with profile_stage(profiler, 'merge_periods', input_rows=len(researcher_df)) as record:
+        merged_df = merge_participation_periods(researcher_df)
+        record['output_rows'] = len(merged_df)
+    if on_table is not None:
+        on_table(EXPORT_TABLE_NAMES[2], merged_df)
+    return project_df, researcher_df, merged_df
+
+# 기간통합 DataFrame으로 동시참여 분석 (profiler가 있으면 측정)
+def _analyze_concurrency_stage(merged_df, profiler=None):
+    with profile_stage(profiler, 'concurrency', input_rows=len(merged_df)) as record:
+        concurrency_tables = analyze_concurrent_participation(merged_df)
+        record['output_rows'] = sum(len(df) for df in concurrency_tables.values())
+    return concurrency_tables
+
+# 여러 txt 파일을 통합 처리하여 엑셀로 저장
+# - 과제정보는 중복 없이 하나의 시트
+# - concurrency=True면 동시참여 분석(요약/중복참여/추이) 시트를 과제정보 다음에 추가
+# - 연구원정보/기간병합은 연구원별로 각각 시트 생성
+def save_merged_to_excel(all_project_info, all_researcher_info, output_path, merged_suffix='(통합)', profiler=None,
+                         concurrency=False):
+    project_df, researcher_df, merged_df = build_participation_tables(all_project_info, all_researcher_info, profiler)
+    concurrency_tables = _analyze_concurrency_stage(merged_df, profiler) if concurrency else None
+    # 엑셀로 저장 (연구원별 시트 분리)
+    with profile_stage(profiler, 'write_excel', input_rows=len(project_df) + len(researcher_df) + len(merged_df)) as record:
+        write_participation_workbook(output_path, project_df, researcher_df, merged_df, merged_suffix,
+                                     extra_tables=concurrency_tables)
+        record['output_rows'] = len(project_df) + len(researcher_df) + len(merged_df)
+
+# 여러 txt 파일을 통합 처리하여 표마다 fmt('csv', 'jsonl', 'parquet') 파일로 저장
+# - 파일 경로: output_prefix + '_' + 표 이름 + '.' + fmt
+# - concurrency=True면 동시참여 분석 표도 저장
+# 반환: 저장한 파일 경로 리스트
+def save_merged_tables(all_project_info, all_researcher_info, output_prefix, fmt, profiler=None, concurrency=False):
+    if fmt in _ROW_WRITERS and not concurrency:
+        return _save_merged_rows(all_project_info, all_researcher_info, output_prefix, fmt, profiler)
+    project_df, researcher_df, merged_df = build_participation_tables(all_project_info, all_researcher_info, profiler)
+    tables = participation_tables(project_df, researcher_df, merged_df)
+    if concurrency:
+        tables.update(_analyze_concurrency_stage(merged_df, profiler))
+    output_paths = []
+    with profile_stage(profiler, f'write_{fmt}', input_rows=sum(len(df) for df in tables.values())) as record:
+        for name, df in tables.items():
+            output_path = f'{output_prefix}_{name}.{fmt}'
+            write_table(output_path, df, fmt)
+            output_paths.append(output_path)
+        record['output_rows'] = sum(len(df) for df in tables.values())
+    return output_paths
+
+# save_merged_tables의 csv/jsonl 저장 (동시참여 분석 제외): participation_core의 행 단위 함수로
+# 과제정보/연구원정보/기간통합 표를 만들어 바로 기록하므로 numpy/pandas를 import하지 않음
+def _save_merged_rows(all_project_info, all_researcher_info, output_prefix, fmt, profiler=None):
+    with profile_stage(profiler, 'build_project_rows', input_rows=len(all_project_info)) as record:
+        project_rows = build_project_rows(all_project_info)
+        record['output_rows'] = len(project_rows)
+    with profile_stage(profiler, 'merge_support_agency', input_rows=len(all_researcher_info)) as record:
+        researcher_rows = build_researcher_rows(all_researcher_info, project_rows)
+        record['output_rows'] = len(researcher_rows)
+    with profile_stage(profiler, 'merge_periods', input_rows=len(researcher_rows)) as record:
+        merged_rows = merge_period_rows(researcher_rows)
+        record['output_rows'] = len(merged_rows)
+    tables = {
+        EXPORT_TABLE_NAMES[0]: (PROJECT_KEYS, project_rows),
+        EXPORT_TABLE_NAMES[1]: (RESEARCHER_TABLE_COLUMNS, researcher_rows),
+        EXPORT_TABLE_NAMES[2]: (RESEARCHER_TABLE_COLUMNS, merged_rows),
+    }
+    output_paths = []
+    with profile_stage(profiler, f'write_{fmt}', input_rows=sum(len(rows) for _, rows in tables.values())) as record:
+        for name, (columns, rows) in tables.items():
+            output_path = f'{output_prefix}_{name}.{fmt}'
+            with open(output_path, 'wb') as f:
+                _ROW_WRITERS[fmt](f, columns, rows)
+            output_paths.append(output_path)
+        record['output_rows'] = sum(len(rows) for _, rows in tables.values())
+    return output_paths
 
 # 현재 폴더 내 모든 txt 파일을 통합 처리
-# - 모든 txt 파일에서 과제정보/연구원정보를 추출해 통합
-# - 엑셀로 저장
-def process_all_txt_files_and_merge():
+# - 모든 txt 파일에서 과제정보/연구원정보를 추출해 통합 (workers개 작업자로 병렬 파싱)
+# - store_path가 있으면 파싱 결과 저장소를 사용해 새 파일/바뀐 파일만 파싱
+# - fmt 형식으로 저장: 'xlsx'는 통합 엑셀 하나, 그 밖에는 표마다 파일 하나 (profiler가 있으면 단계별로 측정)
+# - concurrency=True면 연구원별 동시참여 분석 결과도 저장
+# - dedup=True면 여러 파일에 겹쳐 들어 있는 같은 참여확인서는 한 번만 반영
+#   (저장소를 쓰지 않으면 한 번만 파싱, 저장소를 쓰면 파일별로 보관하고 불러올 때 걸러 냄)
+def process_all_txt_files_and_merge(workers=None, executor='process', store_path=None, profiler=None, fmt='xlsx',
+                                    concurrency=False, dedup=True):
     current_dir = os.path.dirname(os.path.abspath(__file__))
-    txt_files = [f for f in os.listdir(current_dir) if f.lower().endswith('.txt')]
-    all_project_info = []
-    all_researcher_info = []
-    for txt_file in txt_files:
-        txt_path = os.path.join(current_dir, txt_file)
-        project_info_list, researcher_info_list = parse_txt_file(txt_path)
-        all_project_info.extend(project_info_list)
-        all_researcher_info.extend(researcher_info_list)
-    # 결과 엑셀 파일명에 실행 시각 추가
+    txt_files = sorted(f for f in os.listdir(current_dir) if f.lower().endswith('.txt'))
+    txt_paths = [os.path.join(current_dir, txt_file) for txt_file in txt_files]
+    if store_path is not None:
+        all_project_info, all_researcher_info, duplicate_blocks = _load_txt_files_with_store(
+            txt_paths, store_path, workers, executor, profiler, dedup)
+    else:
+        input_bytes = sum(os.path.getsize(txt_path) for txt_path in txt_paths)
+        with profile_stage(profiler, 'parse', input_bytes=input_bytes) as record:
+            results = parse_txt_files(txt_paths, workers=workers, executor=executor, dedup=dedup)
+            for result in results:
+                if result.error is not None:
+                    print(f"파일 '{os.path.basename(result.txt_path)}' 처리 중 오류: {result.error}")
+            duplicate_blocks = sum(result.duplicate_blocks for result in results)
+            all_project_info, all_researcher_info = concat_parse_results(results)
+            del results
+            record['output_rows'] = len(all_project_info) + len(all_researcher_info)
+    if duplicate_blocks:
+        print(f"중복 참여확인서 {duplicate_blocks}건은 한 번만 반영했습니다.")
+    # 결과 파일명에 실행 시각 추가
     now_str = datetime.datetime.now().strftime('%Y%m%d_%H%M')
-    output_path = os.path.join(current_dir, f'연구과제_참여이력_통합_{now_str}.xlsx')
-    save_merged_to_excel(all_project_info, all_researcher_info, output_path)
-    print(f"모든 txt 파일을 통합하여 {os.path.basename(output_path)}로 저장 완료.")
+    output_prefix = os.path.join(current_dir, f'연구과제_참여이력_통합_{now_str}')
+    if fmt == 'xlsx':
+        output_path = output_prefix + '.xlsx'
+        save_merged_to_excel(all_project_info, all_researcher_info, output_path, profiler=profiler,
+                             concurrency=concurrency)
+        print(f"모든 txt 파일을 통합하여 {os.path.basename(output_path)}로 저장 완료.")
+    else:
+        output_paths = save_merged_tables(all_project_info, all_researcher_info, output_prefix, fmt,
+                                          profiler=profiler, concurrency=concurrency)
+        print(f"모든 txt 파일을 통합하여 {', '.join(os.path.basename(path) for path in output_paths)}로 저장 완료.")
+
+# 저장소를 txt_paths와 맞춘 뒤 저장소의 전체 기록을 반환 (dedup=True면 중복 참여확인서는 한 번만)
+# 반환: (과제정보 ColumnarTable, 연구원정보 ColumnarTable, 건너뛴 중복 블록 수)
+def _load_txt_files_with_store(txt_paths, store_path, workers, executor, profiler=None, dedup=True):
+    # 저장소를 쓸 때만 import (sqlite3를 불러오지 않아 시작이 빠름)
+    from participation_store import open_store, sync_store, load_records
+    conn = open_store(store_path)
+    try:
+        with profile_stage(profiler, 'sync_store') as record:
+            summary = sync_store(conn, txt_paths, workers=workers, executor=executor)
+            record['output_rows'] = len(summary['parsed'])
+        for txt_path, error in summary['errors']:
+            print(f"파일 '{os.path.basename(txt_path)}' 처리 중 오류: {error}")
+        print(f"저장소 갱신: 새로 파싱 {len(summary['parsed'])}개, 변경 없음 {len(summary['unchanged'])}개, "
+              f"삭제 {len(summary['removed'])}개")
+        with profile_stage(profiler, 'load_store') as record:
+            all_project_info, all_researcher_info, duplicate_blocks = load_records(conn, dedup)
+            record['output_rows'] = len(all_project_info) + len(all_researcher_info)
+        return all_project_info, all_researcher_info, duplicate_blocks
+    finally:
+        conn.close()
+
+# 명령행 인자
+# stats_path가 있으면 with 블록 동안 cProfile로 측정해 끝날 때 stats_path에 저장
+@contextlib.contextmanager
+def cprofile_stats(stats_path):
+    if stats_path is None:
+        yield
+        return
+    code_profiler = cProfile.Profile()
+    code_profiler.enable()
+    try:
+        yield
+    finally:
+        code_profiler.disable()
+        code_profiler.dump_stats(stats_path)
+        print(f"cProfile 결과 저장: {stats_path}")
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='연구과제 참여확인서 txt 파일들을 통합하여 엑셀로 저장')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='파싱 작업자 수 (기본값: CPU 수, 1이면 순차 처리)')
+    parser.add_argument('--executor', choices=['process', 'thread'], default='process',
+                        help='작업자 종류 (기본값: process)')
+    parser.add_argument('--store', nargs='?', const='', default=None, metavar='DB_PATH',
+                        help='파싱 결과 저장소(SQLite)를 사용해 새 파일/바뀐 파일만 파싱 '
+                             '(경로 생략 시 스크립트 폴더의 .participation_store.sqlite3, '
+                             '감시 모드에서는 이 컴퓨터의 상태 폴더)')
+    parser.add_argument('--format', choices=EXPORT_FORMATS, default='xlsx', dest='fmt',
+                        help='저장 형식 (기본값: xlsx, csv/jsonl/parquet는 과제정보/연구원정보/기간통합 표마다 파일 하나)')
+    parser.add_argument('--no-dedup', dest='dedup', action='store_false',
+                        help='여러 파일에 겹친 같은 참여확인서도 모두 반영 (기본값: 한 번만 반영)')
+    parser.add_argument('--concurrency', action='store_true',
+                        help='연구원별 동시참여 분석(요약/중복참여/추이)을 함께 저장')
+    parser.add_argument('--watch', nargs='?', const='', default=None, metavar='INPUT_DIR',
+                        help='INPUT_DIR(생략 시 스크립트 폴더)을 감시하며 txt 파일이 바뀔 때마다 결과 파일을 갱신 '
+                             '(파싱 결과 저장소 사용, 작업자 수 기본값 1)')
+    parser.add_argument('--output-dir', default=None,
+                        help='감시 모드 결과 파일 폴더 (기본값: INPUT_DIR)')
+    parser.add_argument('--poll-interval', type=float, default=5.0,
+                        help='감시 모드 폴더 확인 간격(초) (기본값: 5)')
+    parser.add_argument('--debounce', type=float, default=2.0,
+                        help='감시 모드에서 마지막 변화 후 반영까지 기다리는 시간(초) (기본값: 2)')
+    parser.add_argument('--profile', action='store_true',
+                        help='단계별 실행 시간/최대 메모리/행 수를 측정해 출력')
+    parser.add_argument('--cprofile', default=None, metavar='STATS_PATH',
+                        help='cProfile 결과를 STATS_PATH에 저장 (python -m pstats로 확인, '
+                             '감시 모드에서는 감시를 끝낼 때 감시 기간 전체의 결과를 저장)')
+    args = parser.parse_args(argv)
+    if args.workers is not None and args.workers < 1:
+        parser.error('--workers는 1 이상이어야 합니다')
+    if args.poll_interval <= 0:
+        parser.error('--poll-interval은 0보다 커야 합니다')
+    if args.debounce < 0:
+        parser.error('--debounce는 0 이상이어야 합니다')
+    if args.watch == '':
+        args.watch = os.path.dirname(os.path.abspath(__file__))
+    if args.watch is not None and not os.path.isdir(args.watch):
+        parser.error(f'--watch 폴더가 없습니다: {args.watch}')
+    if args.store == '':
+        # 감시 모드는 watch_folder의 기본값(로컬 상태 폴더) 사용
+        args.store = None if args.watch is not None else os.path.join(
+            os.path.dirname(os.path.abspath(__file__)), '.participation_store.sqlite3')
+    return args
 
 if __name__ == "__main__":
-    process_all_txt_files_and_merge()
\ No newline at end of file
+    args = parse_args()
+    if args.watch is not None:
+        # participation_watch가 이 모듈을 import하므로 여기서 import
+        import signal
+        from participation_watch import watch_folder
+        # 서비스로 실행할 때 SIGTERM도 Ctrl+C처럼 처리해 저장소를 닫고 종료
+        signal.signal(signal.SIGTERM, signal.default_int_handler)
+        with cprofile_stats(args.cprofile):
+            watch_folder(args.watch, output_dir=args.output_dir, fmt=args.fmt, store_path=args.store,
+                         workers=args.workers or 1, executor=args.executor, poll_interval=args.poll_interval,
+                         debounce=args.debounce, concurrency=args.concurrency, dedup=args.dedup,
+                         profile=args.profile)
+        raise SystemExit
+    profiler = PipelineProfiler() if args.profile else None
+    with cprofile_stats(args.cprofile):
+        process_all_txt_files_and_merge(workers=args.workers, executor=args.executor,
+                                        store_path=args.store, profiler=profiler, fmt=args.fmt,
+                                        concurrency=args.concurrency, dedup=args.dedup)
+    if profiler is not None:
+        print(profiler.format_report())
@@ -0,0 +1,6 @@
+# 테스트에서 저장소 최상위 모듈(project_participation_excel, participation_core 등)을 import할 수 있게 함
+import os
+import sys
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
@@ -0,0 +1,105 @@
+# 동시참여 분석(build_participation_intervals, concurrency_timeline, overlap_pairs, _count_overlap_pairs) 테스트
+
+import datetime
+import random
+
+import pandas as pd
+import pytest
+
+from project_participation_excel import (
+    build_participation_intervals, concurrency_timeline, overlap_pairs, _count_overlap_pairs,
+    analyze_concurrent_participation
+)
+
+COLUMNS = ['과제번호', '성명', '주민번호', '연구원구분', '참여기간']
+
+def _merged_df(rows):
+    return pd.DataFrame(rows, columns=COLUMNS)
+
+def _row(project, period, name='홍길동', role='참여연구원'):
+    return (project, name, '800101-1******', role, period)
+
+# 한 연구원의 기간들 (A: 1~6월, B: 3~4월, C: 4~9월, A의 역할 변경 구간 7~8월)
+ROWS = [
+    _row('A', '2020-01-01 ~ 2020-06-30'),
+    _row('A', '2020-07-01 ~ 2020-08-31', role='연구책임자'),
+    _row('B', '2020-03-01 ~ 2020-04-30'),
+    _row('C', '2020-04-01 ~ 2020-09-30'),
+    _row('D', '2020-05-01'),
+    _row('D', '2020-12-01 ~ 2020-11-01'),
+]
+
+def _day(text):
+    return (datetime.date.fromisoformat(text) - datetime.date(1970, 1, 1)).days
+
+# 같은 과제의 이어지는 기간(역할 변경)은 한 구간, 형식이 다르거나 뒤바뀐 기간은 제외
+def test_build_participation_intervals():
+    intervals = build_participation_intervals(_merged_df(ROWS))
+    assert list(intervals.offsets) == [0, 3]
+    assert list(intervals.projects) == ['A', 'B', 'C']
+    assert list(intervals.starts) == [_day('2020-01-01'), _day('2020-03-01'), _day('2020-04-01')]
+    assert list(intervals.ends) == [_day('2020-08-31'), _day('2020-04-30'), _day('2020-09-30')]
+
+def test_concurrency_timeline():
+    timeline = concurrency_timeline(build_participation_intervals(_merged_df(ROWS)))
+    assert [tuple(row) for row in timeline[['시작일', '종료일', '동시참여과제수']].itertuples(index=False)] == [
+        ('2020-01-01', '2020-02-29', 1),
+        ('2020-03-01', '2020-03-31', 2),
+        ('2020-04-01', '2020-04-30', 3),
+        ('2020-05-01', '2020-08-31', 2),
+        ('2020-09-01', '2020-09-30', 1),
+    ]
+
+def test_overlap_pairs():
+    pairs = overlap_pairs(build_participation_intervals(_merged_df(ROWS)))
+    # 같은 구간에서 시작하는 쌍끼리의 순서는 정하지 않음
+    assert sorted(pairs[['과제번호_1', '과제번호_2', '중복시작일', '중복종료일', '중복일수']]
+                  .itertuples(index=False, name=None)) == [
+        ('A', 'B', '2020-03-01', '2020-04-30', 61),
+        ('A', 'C', '2020-04-01', '2020-08-31', 153),
+        ('B', 'C', '2020-04-01', '2020-04-30', 30),
+    ]
+
+# 나열하는 쌍 수를 제한해도 요약 표의 쌍 수는 정확함
+@pytest.mark.parametrize('max_pairs', [0, 1, 2, 3, 10])
+def test_pair_list_cap_keeps_exact_counts(max_pairs):
+    rows = ROWS + [_row('X', '2020-01-01 ~ 2020-12-31', name='김철수'),
+                   _row('Y', '2020-06-01 ~ 2020-06-30', name='김철수')]
+    tables = analyze_concurrent_participation(_merged_df(rows), max_pairs=max_pairs)
+    assert len(tables['중복참여']) == min(max_pairs, 4)
+    assert list(tables['동시참여_요약']['중복참여쌍수']) == [3, 1]
+    assert list(tables['동시참여_요약']['최대동시참여과제수']) == [3, 2]
+
+# 임의의 기간으로 날짜별 직접 센 결과와 비교
+def test_against_brute_force():
+    rng = random.Random(0)
+    rows = []
+    for name in ['갑', '을', '병']:
+        for project in 'PQRSTU':
+            for _ in range(rng.randint(0, 3)):
+                start = datetime.date(2020, 1, 1) + datetime.timedelta(days=rng.randint(0, 120))
+                end = start + datetime.timedelta(days=rng.randint(0, 60))
+                rows.append(_row(project, f'{start} ~ {end}', name=name))
+    intervals = build_participation_intervals(_merged_df(rows))
+    timeline = concurrency_timeline(intervals)
+    for researcher_id, name in enumerate(intervals.researchers['성명']):
+        days = {}
+        for project, period in {(row[0], row[4]) for row in rows if row[1] == name}:
+            start, end = (datetime.date.fromisoformat(part.strip()) for part in period.split('~'))
+            while start <= end:
+                days.setdefault(start, set()).add(project)
+                start += datetime.timedelta(days=1)
+        expected = {day: len(projects) for day, projects in days.items()}
+        actual = {}
+        for row in timeline[timeline['성명'] == name].itertuples(index=False):
+            day = datetime.date.fromisoformat(row.시작일)
+            while day <= datetime.date.fromisoformat(row.종료일):
+                actual[day] = row.동시참여과제수
+                day += datetime.timedelta(days=1)
+        assert actual == expected
+        # 겹치는 과제 쌍 수: 구간 쌍마다 직접 비교
+        lo, hi = intervals.offsets[researcher_id], intervals.offsets[researcher_id + 1]
+        expected_pairs = sum(1 for i in range(lo, hi) for j in range(i + 1, hi)
+                             if intervals.starts[i] <= intervals.ends[j] and intervals.starts[j] <= intervals.ends[i])
+        assert _count_overlap_pairs(intervals)[researcher_id] == expected_pairs
+        assert (overlap_pairs(intervals)['성명'] == name).sum() == expected_pairs
@@ -0,0 +1,47 @@
+# pandas 없는 핵심 모듈(participation_core) 테스트
+
+import os
+import sys
+import subprocess
+
+import pandas as pd
+import pytest
+
+from participation_core import (
+    parse_txt_file, build_project_rows, build_researcher_rows, merge_period_rows, RESEARCHER_TABLE_COLUMNS
+)
+from project_participation_excel import merge_participation_periods, build_participation_tables
+from test_period_merge import CASES, COLUMNS
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURE_DIR = os.path.join(REPO_DIR, 'tests', 'fixtures')
+
+def _df_rows(df):
+    return [tuple(None if pd.isna(value) else value for value in row) for row in df.itertuples(index=False, name=None)]
+
+# merge_period_rows(행 tuple)와 merge_participation_periods(DataFrame)의 결과가 같음
+@pytest.mark.parametrize('case', list(CASES))
+def test_merge_period_rows_matches_dataframe(case):
+    rows, _ = CASES[case]
+    assert COLUMNS == RESEARCHER_TABLE_COLUMNS
+    expected = _df_rows(merge_participation_periods(pd.DataFrame(rows, columns=COLUMNS)))
+    assert merge_period_rows(rows) == expected
+
+@pytest.mark.parametrize('name', ['generated_sample', 'edge_cases'])
+def test_row_tables_match_dataframes(name):
+    all_project_info, all_researcher_info = parse_txt_file(os.path.join(FIXTURE_DIR, name + '.txt'))
+    project_df, researcher_df, merged_df = build_participation_tables(all_project_info, all_researcher_info)
+    project_rows = build_project_rows(all_project_info)
+    researcher_rows = build_researcher_rows(all_researcher_info, project_rows)
+    assert project_rows == _df_rows(project_df)
+    assert researcher_rows == _df_rows(researcher_df)
+    assert merge_period_rows(researcher_rows) == _df_rows(merged_df)
+
+# 메인 모듈을 import해도 pandas/numpy/openpyxl은 불러오지 않음 (필요한 함수 안에서만 import)
+def test_import_does_not_load_pandas():
+    script = ('import sys, project_participation_excel\n'
+              'print(sorted(name for name in ("pandas", "numpy", "openpyxl") if name in sys.modules))')
+    completed = subprocess.run([sys.executable, '-c', script], cwd=REPO_DIR, capture_output=True, text=True,
+                               timeout=60)
+    assert completed.returncode == 0, completed.stderr
+    assert completed.stdout.strip() == '[]'
@@ -0,0 +1,71 @@
+# 여러 파일에 겹쳐 있는 참여확인서 블록 중복 제거 테스트
+
+import os
+
+import pytest
+
+from participation_core import parse_txt_files, _DECODE_CHUNK_SIZE
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+def _sample_bytes():
+    with open(os.path.join(FIXTURE_DIR, 'generated_sample.txt'), 'rb') as f:
+        return f.read()
+
+# 블록을 몇 개 파싱한 뒤에(첫 디코딩 조각 다음) 디코딩 오류가 나는 파일의 블록은
+# 뒤의 정상 파일에서 중복으로 건너뛰지 않음 (순차/병렬 처리 결과가 같아야 함)
+@pytest.mark.parametrize('workers', [1, 2])
+def test_failed_file_does_not_claim_blocks(workers):
+    good = _sample_bytes()
+    corrupt = good + b'\n' * _DECODE_CHUNK_SIZE + b'\xff\xff'
+    failed, parsed = parse_txt_files([corrupt, good], workers=workers, executor='thread', dedup=True)
+    expected, = parse_txt_files([good], workers=1)
+    assert failed.error is not None
+    assert parsed.error is None
+    assert parsed.duplicate_blocks == 0
+    assert list(parsed.project_table.iter_rows()) == list(expected.project_table.iter_rows())
+    assert list(parsed.researcher_table.iter_rows()) == list(expected.researcher_table.iter_rows())
+
+# 같은 파일 두 개: 두 번째 파일의 블록은 모두 건너뜀
+@pytest.mark.parametrize('workers', [1, 2])
+def test_duplicate_file_is_skipped(workers):
+    good = _sample_bytes()
+    first, second = parse_txt_files([good, good], workers=workers, executor='thread', dedup=True)
+    assert len(first.project_table) > 0
+    assert len(second.project_table) == 0 and len(second.researcher_table) == 0
+    assert second.duplicate_blocks > 0
+
+# 줄 구성만 다른 참여확인서(성명 줄 다음 빈 줄)는 파싱 결과가 다르므로 중복으로 보지 않음
+def test_blocks_differing_only_in_line_breaks_are_not_duplicates():
+    certificate = ('연구과제 참여확인서\n■ 과제정보\n과제번호\tA1\n과 제 명\t과제\n'
+                   '■ 연구원정보\n성명: 갑\t주민번호: 1\n{blank}'
+                   '과제번호\t과제명\t성명\t주민번호\t구분\t과정\t소속\t참여기간\n'
+                   'A1\t과제\t갑\t1\t참여연구원\t해당없음\t소속\t2020-01-01 ~ 2020-12-31\n')
+    x = certificate.format(blank='').encode('utf-8')
+    y = certificate.format(blank='\n').encode('utf-8')
+    expected = parse_txt_files([x, y], workers=1)
+    assert ([list(result.researcher_table.iter_rows()) for result in expected][0]
+            != [list(result.researcher_table.iter_rows()) for result in expected][1])
+    for workers in (1, 2):
+        results = parse_txt_files([x, y], workers=workers, executor='thread', dedup=True)
+        assert [result.duplicate_blocks for result in results] == [0, 0]
+        assert ([list(result.researcher_table.iter_rows()) for result in results]
+                == [list(result.researcher_table.iter_rows()) for result in expected])
+
+# 일부 블록만 겹치는 파일: 겹치는 블록의 행만 빠지고 나머지 블록의 행은 그대로 남음
+@pytest.mark.parametrize('workers', [1, 2])
+def test_partially_overlapping_file_keeps_new_blocks(workers):
+    certificate = ('연구과제 참여확인서\n■ 과제정보\n과제번호\t{number}\n과 제 명\t과제{number}\n'
+                   '■ 연구원정보\n성명: 갑\t주민번호: 1\n'
+                   '과제번호\t과제명\t성명\t주민번호\t구분\t과정\t소속\t참여기간\n'
+                   '{number}\t과제{number}\t갑\t1\t참여연구원\t해당없음\t소속\t2020-01-01 ~ 2020-12-31\n')
+    a, b, c = (certificate.format(number=number) for number in ('A1', 'B2', 'C3'))
+    x = (a + b).encode('utf-8')
+    y = (b + c).encode('utf-8')
+    expected, = parse_txt_files([c.encode('utf-8')], workers=1)
+    first, second = parse_txt_files([x, y], workers=workers, executor='thread', dedup=True)
+    assert first.duplicate_blocks == 0 and len(first.project_table) == 2
+    assert second.duplicate_blocks == 1
+    assert list(second.project_table.iter_rows()) == list(expected.project_table.iter_rows())
+    assert list(second.researcher_table.iter_rows()) == list(expected.researcher_table.iter_rows())
+    assert second.blocks is None
@@ -0,0 +1,30 @@
+# 표 형식 내보내기 테스트: pandas 없이 저장(행 단위)한 결과와 DataFrame으로 저장한 결과가 같아야 함
+
+import os
+
+import pytest
+
+from participation_core import parse_txt_file
+from project_participation_excel import (
+    save_merged_tables, build_participation_tables, participation_tables, write_table
+)
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+@pytest.mark.parametrize('fmt', ['csv', 'jsonl'])
+def test_row_and_dataframe_writers_match(tmp_path, fmt):
+    all_project_info, all_researcher_info = parse_txt_file(os.path.join(FIXTURE_DIR, 'generated_sample.txt'))
+    # '/'가 들어간 값 (DataFrame.to_json은 '\/'로 기록)
+    all_project_info[0]['과제번호'] = 'A/1'
+    for record in all_researcher_info:
+        if record['과제번호'] == all_researcher_info[0]['과제번호']:
+            record['과제번호'] = 'A/1'
+    row_paths = save_merged_tables(all_project_info, all_researcher_info, str(tmp_path / 'rows'), fmt)
+    tables = participation_tables(*build_participation_tables(all_project_info, all_researcher_info))
+    for row_path, df in zip(row_paths, tables.values()):
+        df_path = tmp_path / ('df_' + os.path.basename(row_path))
+        write_table(str(df_path), df, fmt)
+        with open(row_path, 'rb') as f:
+            row_bytes = f.read()
+        assert row_bytes == df_path.read_bytes()
+    assert 'A/1'.encode('utf-8') in row_bytes
@@ -0,0 +1,86 @@
+# 파서 회귀 테스트: 원래(정규식 기반) parse_txt_file의 결과와 비교
+# - fixtures/*.expected.json은 원래 구현으로 만든 기준 결과
+# - generated_sample.txt: benchmarks/generate_samples.py로 만든 가상 데이터 (projects=6, researchers=10, periods=4, seed=1)
+# - edge_cases.txt: 줄 중간의 '연구과제 참여확인서', 과제번호 없는 과제, 열이 모자란 행, 줄 끝 공백 등
+
+import os
+import sys
+import json
+import subprocess
+
+import pytest
+
+from participation_core import (
+    parse_txt_file, parse_txt_source, parse_txt_files, concat_parse_results, PROJECT_KEYS, RESEARCHER_KEYS
+)
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+GOLDEN_FIXTURES = ['generated_sample', 'edge_cases']
+
+def _fixture_path(name, suffix='.txt'):
+    return os.path.join(FIXTURE_DIR, name + suffix)
+
+def _expected(name):
+    with open(_fixture_path(name, '.expected.json'), encoding='utf-8') as f:
+        expected = json.load(f)
+    return expected['projects'], expected['researchers']
+
+@pytest.mark.parametrize('name', GOLDEN_FIXTURES)
+def test_parse_txt_file_matches_baseline(name):
+    projects, researchers = parse_txt_file(_fixture_path(name))
+    expected_projects, expected_researchers = _expected(name)
+    # dict 키 순서까지 같아야 함 (과제정보 시트 열 순서에 영향)
+    assert [list(record.items()) for record in projects] == [list(record.items()) for record in expected_projects]
+    assert researchers == expected_researchers
+
+# 파일 경로, bytes, UTF-8로 바꾼 bytes 모두 같은 결과
+@pytest.mark.parametrize('name', GOLDEN_FIXTURES)
+def test_parse_sources_match_baseline(name):
+    with open(_fixture_path(name), 'rb') as f:
+        data = f.read()
+    expected = _expected(name)
+    assert parse_txt_source(data) == expected
+    assert parse_txt_source(data.decode('cp949').encode('utf-8')) == expected
+    assert parse_txt_source(data.replace(b'\r\n', b'\n')) == expected
+
+# 열 단위 표(병렬 파싱 경로)도 같은 행
+def test_columnar_tables_match_baseline():
+    paths = [_fixture_path(name) for name in GOLDEN_FIXTURES]
+    project_table, researcher_table = concat_parse_results(parse_txt_files(paths, workers=1))
+    expected_projects, expected_researchers = [], []
+    for name in GOLDEN_FIXTURES:
+        projects, researchers = _expected(name)
+        expected_projects += projects
+        expected_researchers += researchers
+    assert list(project_table.iter_rows()) == [tuple(record.get(key) for key in PROJECT_KEYS)
+                                               for record in expected_projects]
+    assert list(researcher_table.iter_rows()) == [tuple(record[key] for key in RESEARCHER_KEYS)
+                                                  for record in expected_researchers]
+
+# 원래 구현과 일부러 다르게 처리하는 경우: 과제정보보다 먼저 나온 연구원정보는 무시
+# (원래 구현은 앞쪽 연구원정보부터 과제정보 줄까지를 연구원 행으로 읽었음)
+def test_researcher_section_before_project_section_is_ignored():
+    projects, researchers = parse_txt_file(_fixture_path('section_order'))
+    assert projects == [{'과제번호': 'D1', '연구기간': '2020-01-01 ~ 2021-12-31', '과 제 명': '순서가 바뀐 과제'}]
+    assert researchers == [{'과제번호': 'D1', '과 제 명': '순서가 바뀐 과제', '성명': '을', '주민번호': '2',
+                            '연구원구분': '공동연구원', '과정구분': '석사과정', '소속': '물리학과',
+                            '참여기간': '2021-01-01 ~ 2021-06-30'}]
+
+# 읽는 중에 파일이 줄어들어도(다른 사람이 덮어씀) 프로세스가 죽지 않고 읽은 데까지만 처리
+# (mmap으로 읽으면 SIGBUS로 종료되므로 subprocess에서 확인)
+def test_file_truncated_while_reading(tmp_path):
+    txt_path = tmp_path / 'truncated.txt'
+    with open(_fixture_path('generated_sample'), 'rb') as f:
+        txt_path.write_bytes(f.read() * 20)
+    script = (
+        'import os, sys\n'
+        'from participation_core import iter_source_lines\n'
+        'lines = iter_source_lines(sys.argv[1], chunk_size=4096)\n'
+        'next(lines)\n'
+        'os.truncate(sys.argv[1], 100)\n'
+        'print(sum(1 for _ in lines) >= 0)\n'
+    )
+    completed = subprocess.run([sys.executable, '-c', script, str(txt_path)], capture_output=True, text=True,
+                               cwd=os.path.dirname(os.path.dirname(FIXTURE_DIR)), timeout=60)
+    assert completed.returncode == 0, completed.stderr
+    assert completed.stdout.strip() == 'True'
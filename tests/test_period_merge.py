@@ -0,0 +1,56 @@
+# 참여기간 병합(merge_participation_periods) 테스트
+
+import pandas as pd
+import pytest
+
+from project_participation_excel import merge_participation_periods
+
+COLUMNS = ['과제번호', '과 제 명', '지원기관', '성명', '주민번호', '연구원구분', '과정구분', '소속', '참여기간']
+
+def _row(period, name='홍길동', project='P1', role='참여연구원'):
+    return (project, '과제 ' + project, '기관', name, '800101-1******', role, '해당없음', '고려대학교', period)
+
+# (입력 행, 병합된 행)
+CASES = {
+    # 종료일 다음날 시작하면 하나로 합침 (월/연도 경계 포함)
+    'day_adjacent': (
+        [_row('2020-01-01 ~ 2020-01-31'), _row('2020-02-01 ~ 2020-12-31'), _row('2021-01-01 ~ 2021-06-30')],
+        [_row('2020-01-01 ~ 2021-06-30')],
+    ),
+    # 입력 순서와 관계없이 시작일 순으로 합침
+    'unordered': (
+        [_row('2020-02-01 ~ 2020-02-29'), _row('2020-01-01 ~ 2020-01-31')],
+        [_row('2020-01-01 ~ 2020-02-29')],
+    ),
+    # 하루라도 비거나 겹치면 합치지 않음
+    'gapped_or_overlapping': (
+        [_row('2020-01-01 ~ 2020-01-31'), _row('2020-02-02 ~ 2020-02-29'), _row('2020-02-15 ~ 2020-03-31')],
+        [_row('2020-01-01 ~ 2020-01-31'), _row('2020-02-02 ~ 2020-02-29'), _row('2020-02-15 ~ 2020-03-31')],
+    ),
+    # 형식이 다른 참여기간은 그대로 두고 이웃 기간과 합치지 않음
+    'malformed': (
+        [_row('2020-01-01 ~ 2020-01-31'), _row('2020-02-01'), _row('2020-13-01 ~ 2020-12-31'),
+         _row('2020-03-01 ~ 2020-03-31')],
+        [_row('2020-01-01 ~ 2020-01-31'), _row('2020-02-01'), _row('2020-03-01 ~ 2020-03-31'),
+         _row('2020-13-01 ~ 2020-12-31')],
+    ),
+    # 같은 과제라도 연구원구분이 바뀌면 다른 그룹 (기간이 이어져도 합치지 않음)
+    'role_change': (
+        [_row('2020-01-01 ~ 2020-06-30', role='참여연구원'), _row('2020-07-01 ~ 2020-12-31', role='연구책임자'),
+         _row('2021-01-01 ~ 2021-12-31', role='연구책임자')],
+        [_row('2020-07-01 ~ 2021-12-31', role='연구책임자'), _row('2020-01-01 ~ 2020-06-30', role='참여연구원')],
+    ),
+    # 연구원 등장 순을 유지하고 성명이 없는 행은 제외
+    'researcher_order': (
+        [_row('2020-01-01 ~ 2020-01-31', name='김철수'), _row('2020-01-01 ~ 2020-01-31', name=None),
+         _row('2020-01-01 ~ 2020-01-31', name='홍길동'), _row('2020-02-01 ~ 2020-02-29', name='김철수')],
+        [_row('2020-01-01 ~ 2020-02-29', name='김철수'), _row('2020-01-01 ~ 2020-01-31', name='홍길동')],
+    ),
+}
+
+@pytest.mark.parametrize('case', list(CASES))
+def test_merge_participation_periods(case):
+    rows, expected = CASES[case]
+    merged_df = merge_participation_periods(pd.DataFrame(rows, columns=COLUMNS))
+    assert list(merged_df.columns) == COLUMNS
+    assert list(merged_df.itertuples(index=False, name=None)) == expected
@@ -0,0 +1,44 @@
+# PipelineProfiler 테스트
+
+import threading
+import time
+import tracemalloc
+
+from project_participation_excel import PipelineProfiler, build_participation_tables
+
+# 두 작업(스레드)이 동시에 메모리를 측정해도 서로의 추적을 멈추거나 최대값을 초기화하지 않음
+def test_concurrent_traced_stages_do_not_interfere():
+    first, second = PipelineProfiler(), PipelineProfiler()
+    second_ready, first_done = threading.Event(), threading.Event()
+
+    def run_first():
+        with first.stage('first'):
+            data = [bytes(1024) for _ in range(1000)]
+            second_ready.wait(5)
+            # 두 번째 단계가 (막혀 있지 않다면) 시작할 시간을 줌
+            time.sleep(0.1)
+            del data
+        first_done.set()
+
+    def run_second():
+        second_ready.set()
+        with second.stage('second'):
+            data = [bytes(1024) for _ in range(100)]
+            first_done.wait(5)
+            del data
+
+    threads = [threading.Thread(target=run_first), threading.Thread(target=run_second)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert first.stages[0]['peak_bytes'] >= 1000 * 1024
+    assert second.stages[0]['peak_bytes'] >= 100 * 1024
+    assert not tracemalloc.is_tracing()
+
+# numpy/pandas import 시간은 과제정보 단계가 아닌 별도 단계(import_pandas)로 기록
+def test_pandas_import_is_a_separate_stage():
+    profiler = PipelineProfiler(trace_memory=False)
+    build_participation_tables([{'과제번호': 'A1', '과 제 명': '과제'}], [], profiler)
+    assert [record['stage'] for record in profiler.stages] == [
+        'import_pandas', 'build_project_df', 'merge_support_agency', 'merge_periods']
@@ -0,0 +1,86 @@
+# 파싱 결과 저장소 테스트
+
+import os
+import sqlite3
+
+import pytest
+
+from participation_core import parse_txt_files, concat_parse_results, content_hash
+from participation_store import open_store, sync_store, load_records, file_content_hash
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+# 겹치는 참여확인서가 있는 파일들: a = 샘플, b = 샘플 + edge_cases, c = edge_cases
+@pytest.fixture
+def overlapping_txt_paths(tmp_path):
+    with open(os.path.join(FIXTURE_DIR, 'generated_sample.txt'), 'rb') as f:
+        sample = f.read()
+    with open(os.path.join(FIXTURE_DIR, 'edge_cases.txt'), 'rb') as f:
+        edge_cases = f.read()
+    paths = []
+    for name, data in [('a.txt', sample), ('b.txt', sample + b'\r\n' + edge_cases), ('c.txt', edge_cases)]:
+        path = tmp_path / name
+        path.write_bytes(data)
+        paths.append(str(path))
+    return paths
+
+def _rows(tables):
+    return [list(table.iter_rows()) for table in tables]
+
+# 저장소에서 불러온 기록은 저장소 없이 파싱한 결과와 같음 (중복 제거 여부 모두)
+@pytest.mark.parametrize('dedup', [True, False])
+def test_load_records_matches_direct_parse(tmp_path, overlapping_txt_paths, dedup):
+    results = parse_txt_files(overlapping_txt_paths, workers=1, dedup=dedup)
+    expected = concat_parse_results(results)
+    conn = open_store(str(tmp_path / 'store.sqlite3'))
+    try:
+        sync_store(conn, overlapping_txt_paths, workers=1)
+        project_table, researcher_table, duplicate_blocks = load_records(conn, dedup)
+    finally:
+        conn.close()
+    assert _rows((project_table, researcher_table)) == _rows(expected)
+    assert duplicate_blocks == sum(result.duplicate_blocks for result in results)
+    assert (duplicate_blocks > 0) == dedup
+
+# 먼저 나온 파일을 지우면 뒤 파일에 있던 같은 참여확인서가 다시 반영됨
+def test_removed_file_releases_duplicates(tmp_path, overlapping_txt_paths):
+    conn = open_store(str(tmp_path / 'store.sqlite3'))
+    try:
+        sync_store(conn, overlapping_txt_paths, workers=1)
+        sync_store(conn, overlapping_txt_paths[1:], workers=1)
+        loaded = load_records(conn)
+    finally:
+        conn.close()
+    expected = concat_parse_results(parse_txt_files(overlapping_txt_paths[1:], workers=1, dedup=True))
+    assert _rows(loaded[:2]) == _rows(expected)
+
+# 예전 형식(블록 정보 없음)의 저장소는 비우고 다시 만듦
+def test_old_store_is_rebuilt(tmp_path, overlapping_txt_paths):
+    store_path = str(tmp_path / 'store.sqlite3')
+    old = sqlite3.connect(store_path)
+    old.executescript('''
+        CREATE TABLE files (path TEXT PRIMARY KEY, size INTEGER NOT NULL, mtime_ns INTEGER NOT NULL,
+                            content_hash TEXT NOT NULL);
+        CREATE TABLE projects (path TEXT NOT NULL, seq INTEGER NOT NULL, record TEXT NOT NULL,
+                               PRIMARY KEY (path, seq));
+        CREATE TABLE researchers (path TEXT NOT NULL, seq INTEGER NOT NULL, record TEXT NOT NULL,
+                                  PRIMARY KEY (path, seq));
+    ''')
+    old.close()
+    conn = open_store(store_path)
+    try:
+        summary = sync_store(conn, overlapping_txt_paths, workers=1)
+        loaded = load_records(conn)
+    finally:
+        conn.close()
+    assert len(summary['parsed']) == len(overlapping_txt_paths)
+    expected = concat_parse_results(parse_txt_files(overlapping_txt_paths, workers=1, dedup=True))
+    assert _rows(loaded[:2]) == _rows(expected)
+
+# 조각 단위로 읽은 파일 해시는 파일 내용 전체의 해시와 같음
+def test_file_content_hash(tmp_path, overlapping_txt_paths):
+    empty_path = tmp_path / 'empty.txt'
+    empty_path.write_bytes(b'')
+    for txt_path in overlapping_txt_paths + [str(empty_path)]:
+        with open(txt_path, 'rb') as f:
+            assert file_content_hash(txt_path) == content_hash(f.read())
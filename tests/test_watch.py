@@ -0,0 +1,73 @@
+# 폴더 감시 모드 테스트
+
+import os
+import pstats
+import signal
+import subprocess
+import sys
+import time
+
+from participation_store import open_store
+from participation_watch import default_watch_store_path, rebuild, WATCH_OUTPUT_NAME
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 기본 저장소는 감시 폴더(공유 폴더일 수 있음)가 아니라 로컬 상태 폴더에, 감시 폴더마다 따로 만듦
+def test_default_store_is_in_local_state_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv('XDG_STATE_HOME', str(tmp_path / 'state'))
+    first = default_watch_store_path(str(tmp_path / 'share' / 'in'))
+    second = default_watch_store_path(str(tmp_path / 'other' / 'in'))
+    assert first.startswith(str(tmp_path / 'state') + os.sep)
+    assert first != second
+
+# 파싱 오류만 난 갱신에서도 (그 파일의 기록이 저장소에서 지워졌으므로) 결과 파일을 다시 만듦
+def test_rebuild_after_parse_error(tmp_path):
+    input_dir, output_dir = tmp_path / 'in', tmp_path / 'out'
+    input_dir.mkdir()
+    output_dir.mkdir()
+    with open(os.path.join(FIXTURE_DIR, 'generated_sample.txt'), 'rb') as f:
+        sample = f.read()
+    with open(os.path.join(FIXTURE_DIR, 'edge_cases.txt'), 'rb') as f:
+        edge_cases = f.read()
+    (input_dir / 'a.txt').write_bytes(sample)
+    (input_dir / 'b.txt').write_bytes(edge_cases)
+    txt_paths = sorted(str(path) for path in input_dir.iterdir())
+    output_path = output_dir / f'{WATCH_OUTPUT_NAME}_과제정보.csv'
+    conn = open_store(str(tmp_path / 'store.sqlite3'))
+    try:
+        assert rebuild(conn, txt_paths, str(output_dir), fmt='csv', force=True)
+        before = output_path.read_bytes()
+        # b.txt를 디코딩할 수 없는 내용으로 바꿈
+        (input_dir / 'b.txt').write_bytes(edge_cases + b'\xff\xff')
+        assert rebuild(conn, txt_paths, str(output_dir), fmt='csv')
+    finally:
+        conn.close()
+    after = output_path.read_bytes()
+    assert after != before
+    assert len(after.splitlines()) < len(before.splitlines())
+
+# --watch와 --cprofile을 함께 쓰면 감시를 끝낼 때(SIGTERM) 감시 기간의 cProfile 결과를 저장
+def test_watch_writes_cprofile_stats_on_exit(tmp_path):
+    input_dir, output_dir = tmp_path / 'in', tmp_path / 'out'
+    input_dir.mkdir()
+    with open(os.path.join(FIXTURE_DIR, 'generated_sample.txt'), 'rb') as f:
+        (input_dir / 'a.txt').write_bytes(f.read())
+    stats_path = tmp_path / 'watch.prof'
+    output_path = output_dir / f'{WATCH_OUTPUT_NAME}_과제정보.csv'
+    process = subprocess.Popen(
+        [sys.executable, 'project_participation_excel.py', '--watch', str(input_dir), '--output-dir', str(output_dir),
+         '--store', str(tmp_path / 'store.sqlite3'), '--format', 'csv', '--poll-interval', '0.1', '--debounce', '0',
+         '--cprofile', str(stats_path)],
+        cwd=REPO_DIR, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    try:
+        deadline = time.monotonic() + 60
+        while not output_path.exists() and process.poll() is None and time.monotonic() < deadline:
+            time.sleep(0.1)
+        assert output_path.exists()
+    finally:
+        process.send_signal(signal.SIGTERM)
+        stdout, stderr = process.communicate(timeout=60)
+    assert process.returncode == 0, stderr
+    functions = {function for _, _, function in pstats.Stats(str(stats_path)).stats}
+    assert 'rebuild' in functions
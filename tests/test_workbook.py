@@ -0,0 +1,33 @@
+# 통합 엑셀(write_participation_workbook) 테스트
+
+import os
+import sys
+import subprocess
+
+import pytest
+
+resource = pytest.importorskip('resource')
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 열린 파일 수 제한(256개)보다 시트가 훨씬 많아도(연구원 600명 -> 시트 1,201개) 저장됨
+# (제한은 테스트 프로세스가 아니라 자식 프로세스에만 걸기 위해 subprocess로 실행)
+_MANY_SHEETS_SCRIPT = '''
+import io
+import resource
+resource.setrlimit(resource.RLIMIT_NOFILE, (256, 256))
+import pandas as pd
+from openpyxl import load_workbook
+from project_participation_excel import write_participation_workbook
+names = ['연구원%04d' % i for i in range(600)]
+df = pd.DataFrame({'성명': names, '과제번호': ['A'] * len(names)})
+output = io.BytesIO()
+write_participation_workbook(output, df, df, df)
+print(len(load_workbook(output, read_only=True).sheetnames))
+'''
+
+def test_many_sheets_under_low_open_file_limit():
+    completed = subprocess.run([sys.executable, '-c', _MANY_SHEETS_SCRIPT], cwd=REPO_DIR,
+                               capture_output=True, text=True, timeout=300)
+    assert completed.returncode == 0, completed.stderr
+    assert completed.stdout.split() == ['1201']
@@ -2,13 +2,17 @@
 # 기존 project_participation_excel.py의 함수들을 재사용
 
 import streamlit as st
-import pandas as pd
-import re
 import os
 import datetime
-import tempfile
 import io
-from pathlib import Path
+import functools
+import time
+import threading
+import contextlib
+import collections
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
 # 페이지 설정
 st.set_page_config(
@@ -17,8 +21,405 @@ st.set_page_config(
     layout="wide"
 )
 
-# 기존 함수들 import (같은 폴더의 project_participation_excel.py에서)
-from project_participation_excel import parse_txt_file, save_merged_to_excel
+# 기존 함수들 import (같은 폴더의 participation_core.py, project_participation_excel.py에서)
+from participation_core import iter_parse_txt_files, concat_parse_results, content_hash
+from project_participation_excel import (
+    build_participation_tables, analyze_concurrent_participation, write_participation_workbook,
+    participation_tables, write_tables_archive, PipelineProfiler, EXPORT_TABLE_NAMES
+)
+
+# 업로드 파일 파싱 작업자 수 (환경변수 PARSE_WORKERS, 미설정 시 CPU 수): 모든 작업이 함께 쓰는 프로세스 수
+PARSE_WORKERS = int(os.environ['PARSE_WORKERS']) if os.environ.get('PARSE_WORKERS') else (os.cpu_count() or 1)
+# 처리 결과/내려받을 파일 캐시: 최대 보관 개수, 전체 크기 상한(MB), 보관 시간(초)
+# (개수나 크기를 넘으면 가장 오래 안 쓴 항목부터 제거)
+RESULT_CACHE_MAX_ENTRIES = int(os.environ.get('RESULT_CACHE_MAX_ENTRIES', '32'))
+RESULT_CACHE_MAX_MB = int(os.environ.get('RESULT_CACHE_MAX_MB', '512'))
+RESULT_CACHE_TTL = int(os.environ.get('RESULT_CACHE_TTL', '3600'))
+# 백그라운드 처리 작업: 서버 전체에서 동시에 실행하는 작업 수(넘으면 차례를 기다림),
+# 작업 하나(세션 하나)의 업로드 크기 상한(MB), 진행 상황을 다시 그리는 간격(초)
+JOB_WORKERS = int(os.environ.get('JOB_WORKERS', '2'))
+JOB_MAX_INPUT_MB = int(os.environ.get('JOB_MAX_INPUT_MB', '200'))
+JOB_POLL_INTERVAL = float(os.environ.get('JOB_POLL_INTERVAL', '0.5'))
+# 미리보기: 필터로 쓰는 색인 열, 한 쪽에 보여 줄 행 수 선택지
+PREVIEW_INDEX_COLUMNS = ['성명', '과제번호', '지원기관']
+PREVIEW_PAGE_SIZES = [50, 100, 500, 1000]
+# 미리보기 필터: 값 종류가 이 개수 이하인 열은 목록에서 고르고, 더 많으면 검색어로 찾음
+# (성명/과제번호처럼 값이 수만 개인 열의 목록 전체를 화면으로 보내지 않도록)
+PREVIEW_SELECT_MAX = int(os.environ.get('PREVIEW_SELECT_MAX', '200'))
+
+# 미리보기용 표 색인
+# - row_count: 전체 행 수
+# - columns: {열 이름: {값: 행 위치 배열(오름차순)}} (PREVIEW_INDEX_COLUMNS 중 표에 있는 열)
+PreviewIndex = collections.namedtuple('PreviewIndex', ['row_count', 'columns'])
+
+# 표 하나의 미리보기 색인 (열마다 groupby 한 번, 값이 없는 행은 색인에서 제외)
+def build_preview_index(df):
+    columns = {column: df.groupby(column, sort=False, observed=True).indices
+               for column in PREVIEW_INDEX_COLUMNS if column in df.columns}
+    return PreviewIndex(len(df), columns)
+
+# 검색어(쉼표로 나누어 여러 개)가 들어 있는 색인 값 리스트 (대소문자 무시)
+def search_index_values(column_index, query):
+    terms = [term.strip().casefold() for term in query.split(',') if term.strip()]
+    return [value for value in column_index if any(term in str(value).casefold() for term in terms)]
+
+# 필터에서 고른 값들의 행 위치 (한 열 안에서는 OR, 열 사이는 AND)
+# - selections: {열 이름: 값 리스트} (필터를 쓰지 않는 열은 넣지 않음, 값 리스트가 비어 있으면 맞는 행 없음)
+def filter_positions(index, selections):
+    import numpy as np
+    positions = None
+    for column, values in selections.items():
+        if values:
+            column_positions = np.unique(np.concatenate([index.columns[column][value] for value in values]))
+        else:
+            column_positions = np.zeros(0, dtype=np.intp)
+        if positions is None:
+            positions = column_positions
+        else:
+            positions = np.intersect1d(positions, column_positions, assume_unique=True)
+    return np.arange(index.row_count) if positions is None else positions
+
+# 색인 기반 미리보기: 색인 열 필터 + 한 쪽 분량의 행만 화면으로 보냄
+# - 값 종류가 PREVIEW_SELECT_MAX개 이하인 열은 목록 선택, 더 많은 열은 검색어 입력
+# - 필터/쪽을 바꾸면 이 부분만 다시 그림
+# - 건수는 DataFrame을 잘라 세지 않고 색인에서 계산
+@st.fragment
+def show_indexed_preview(df, index, key):
+    filter_columns = list(index.columns)
+    selections = {}
+    if filter_columns:
+        for column, container in zip(filter_columns, st.columns(len(filter_columns))):
+            column_index = index.columns[column]
+            with container:
+                if len(column_index) <= PREVIEW_SELECT_MAX:
+                    selected = st.multiselect(column, sorted(column_index, key=str), key=f"{key}_filter_{column}",
+                                              placeholder="전체")
+                    if selected:
+                        selections[column] = selected
+                else:
+                    query = st.text_input(column, key=f"{key}_search_{column}",
+                                          placeholder=f"검색 (값 {len(column_index):,}개, 쉼표로 여러 개)")
+                    if query.strip():
+                        selections[column] = search_index_values(column_index, query)
+    positions = filter_positions(index, selections)
+    total = len(positions)
+    size_col, page_col, count_col = st.columns([1, 1, 2])
+    with size_col:
+        page_size = st.selectbox("쪽당 행 수", PREVIEW_PAGE_SIZES, key=f"{key}_page_size")
+    page_count = max(1, -(-total // page_size))
+    with page_col:
+        page = st.number_input(f"쪽 (전체 {page_count}쪽)", min_value=1, max_value=page_count, value=1,
+                               step=1, key=f"{key}_page")
+    start = (min(page, page_count) - 1) * page_size
+    page_positions = positions[start:start + page_size]
+    with count_col:
+        counts = ', '.join(f"{column} {len(values):,}개" for column, values in index.columns.items())
+        if selections:
+            st.caption(f"조건에 맞는 행 {total:,}개 / 전체 {index.row_count:,}개")
+        else:
+            st.caption(f"전체 {index.row_count:,}행" + (f" ({counts})" if counts else ""))
+    st.dataframe(df.iloc[page_positions], use_container_width=True)
+    if total:
+        st.caption(f"{start + 1:,}–{start + len(page_positions):,}번째 행")
+
+class JobCancelled(Exception):
+    pass
+
+# 업로드 파일 처리 작업 하나의 상태 (작업 스레드가 갱신하고 화면은 주기적으로 읽기만 함)
+# - status: 'queued'(차례 대기), 'running', 'done', 'cancelled', 'failed'
+# - partial_tables: 먼저 만들어진 표 {표 이름: DataFrame} (과제정보부터)
+class ProcessingJob:
+    def __init__(self, key, file_count):
+        self.key = key
+        self.file_count = file_count
+        self.parsed_files = 0
+        self.message = '차례를 기다리는 중...'
+        self.status = 'queued'
+        self.partial_tables = {}
+        self.result = None
+        self.error = None
+        self.future = None
+        self._cancel_event = threading.Event()
+
+    @property
+    def finished(self):
+        return self.status in ('done', 'cancelled', 'failed')
+
+    def report(self, message, parsed_files=None):
+        self.check_cancelled()
+        self.message = message
+        if parsed_files is not None:
+            self.parsed_files = parsed_files
+
+    def add_table(self, name, df):
+        self.check_cancelled()
+        self.partial_tables[name] = df
+
+    def check_cancelled(self):
+        if self._cancel_event.is_set():
+            raise JobCancelled()
+
+    # 중단 요청: 대기 중이면 바로 취소, 실행 중이면 다음 파일/단계에서 멈춤
+    def cancel(self):
+        self._cancel_event.set()
+        if self.future is not None and self.future.cancel():
+            self.status = 'cancelled'
+
+# 모든 세션이 함께 쓰는 작업 풀
+@st.cache_resource
+def get_job_executor():
+    return ThreadPoolExecutor(max_workers=JOB_WORKERS, thread_name_prefix='upload-job')
+
+# 모든 작업이 함께 쓰는 파싱 프로세스 풀 (PARSE_WORKERS개, 파서가 순수 Python이라 스레드로는 CPU 하나만 씀)
+# - 동시에 여러 작업이 돌아도 파싱 작업자 수는 PARSE_WORKERS개를 넘지 않음
+# - 여러 스레드를 가진 서버 프로세스를 fork하지 않도록 forkserver(없으면 spawn)로 작업자를 시작
+#   (업로드 내용은 iter_parse_txt_files에서 bytes로 한 번 복사해 보냄)
+@st.cache_resource
+def get_parse_executor():
+    start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+    return ProcessPoolExecutor(max_workers=PARSE_WORKERS, mp_context=multiprocessing.get_context(start_method))
+
+# 처리 결과/내려받을 파일 캐시 (모든 세션 공유, 스레드 안전)
+# - 항목 수가 max_entries를 넘거나 크기 합계가 max_bytes를 넘으면 가장 오래 안 쓴 항목부터 제거
+# - ttl초가 지난 항목은 만료, max_bytes보다 큰 항목은 보관하지 않음
+class ResultCache:
+    def __init__(self, max_entries, max_bytes, ttl):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.total_bytes = 0
+        self._entries = collections.OrderedDict()  # 키 -> (값, 크기, 저장 시각)
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[2] > self.ttl:
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key, value, size):
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, size, time.monotonic())
+            self.total_bytes += size
+            while len(self._entries) > self.max_entries or self.total_bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def _remove(self, key):
+        _, size, _ = self._entries.pop(key)
+        self.total_bytes -= size
+
+@st.cache_resource
+def get_result_cache():
+    return ResultCache(RESULT_CACHE_MAX_ENTRIES, RESULT_CACHE_MAX_MB * 1024 * 1024, RESULT_CACHE_TTL)
+
+# 처리 결과의 메모리 크기 추정 (표는 memory_usage(deep=True), 색인은 행 위치 배열 크기)
+def result_size(result):
+    tables = [result['project_df'], result['researcher_df'], result['merged_df'],
+              *result['concurrency_tables'].values()]
+    size = sum(int(df.memory_usage(index=True, deep=True).sum()) for df in tables)
+    size += sum(positions.nbytes for index in result['preview_indexes'].values()
+                for values in index.columns.values() for positions in values.values())
+    return size
+
+# 업로드 파일들을 파싱/통합/기간병합 (결과 캐시는 get_processed_result에서)
+# - 단계별 실행 시간/행 수는 항상 기록하고, trace_memory=True면 최대 메모리도 측정
+# - 내려받을 파일은 여기서 만들지 않고 다운로드 버튼을 누를 때 export_results로 만듦
+# - job(ProcessingJob)이 있으면 파일별 진행 상황과 먼저 만들어진 표를 알리고, 중단 요청 시 JobCancelled
+# - executor: 파싱 작업자 풀 (get_parse_executor, None이면 파싱할 때마다 PARSE_WORKERS개 스레드 풀을 만듦)
+# 반환: project_df, researcher_df, merged_df, concurrency_tables(동시참여 분석 {표 이름: DataFrame}),
+#       preview_indexes({표 이름: PreviewIndex}), duplicate_blocks(건너뛴 중복 참여확인서 수), errors([(파일 순번, 오류 메시지)]), profiler
+def process_uploaded_files(uploaded_files, trace_memory=False, job=None, executor=None):
+    profiler = PipelineProfiler(trace_memory=trace_memory)
+    # 업로드 내용을 임시 파일 없이 메모리(memoryview)에서 바로 파싱 (인코딩은 cp949/UTF-8 자동 판별)
+    # 여러 파일은 파싱 프로세스 풀에서 병렬로 파싱 (결과는 업로드 순서 유지)
+    # 과제정보/연구원정보는 행별 dict 없이 열 단위 표(ColumnarTable)로 모음
+    sources = [uploaded_file.getbuffer() for uploaded_file in uploaded_files]
+    with profiler.stage('parse', input_bytes=sum(source.nbytes for source in sources)) as record:
+        parse_results = []
+        # 여러 파일에 겹쳐 들어 있는 같은 참여확인서는 한 번만 파싱
+        with contextlib.closing(iter_parse_txt_files(sources, workers=PARSE_WORKERS, executor=executor or 'thread',
+                                                     dedup=True)) as results:
+            for parse_result in results:
+                parse_results.append(parse_result)
+                if job is not None:
+                    job.report(f"파일 파싱 중... ({len(parse_results)}/{len(sources)})", len(parse_results))
+        errors = [(index, parse_result.error) for index, parse_result in enumerate(parse_results)
+                  if parse_result.error is not None]
+        duplicate_blocks = sum(parse_result.duplicate_blocks for parse_result in parse_results)
+        all_project_info, all_researcher_info = concat_parse_results(parse_results)
+        del parse_results
+        record['output_rows'] = len(all_project_info) + len(all_researcher_info)
+    if job is not None:
+        job.report("과제정보/연구원정보 정리 및 기간통합 중...")
+    project_df, researcher_df, merged_df = build_participation_tables(
+        all_project_info, all_researcher_info, profiler,
+        on_table=job.add_table if job is not None else None)
+    if job is not None:
+        job.report("동시참여 분석 중...")
+    with profiler.stage('concurrency', input_rows=len(merged_df)) as record:
+        concurrency_tables = analyze_concurrent_participation(merged_df)
+        record['output_rows'] = sum(len(df) for df in concurrency_tables.values())
+    # 미리보기 색인 (과제정보/연구원정보/기간통합/동시참여 분석 표)
+    with profiler.stage('build_indexes', input_rows=len(project_df) + len(researcher_df) + len(merged_df)) as record:
+        tables = dict(zip(EXPORT_TABLE_NAMES, (project_df, researcher_df, merged_df)))
+        tables.update(concurrency_tables)
+        preview_indexes = {name: build_preview_index(df) for name, df in tables.items()}
+        record['output_rows'] = sum(len(values) for index in preview_indexes.values() for values in index.columns.values())
+    return {
+        'project_df': project_df,
+        'researcher_df': researcher_df,
+        'merged_df': merged_df,
+        'concurrency_tables': concurrency_tables,
+        'preview_indexes': preview_indexes,
+        'duplicate_blocks': duplicate_blocks,
+        'errors': errors,
+        'profiler': profiler,
+    }
+
+# 캐시된 처리 결과가 있으면 그대로, 없으면 처리해 캐시에 넣음
+# - (file_hashes(파일 내용 해시 튜플), trace_memory)가 캐시 키: 같은 내용의 파일이면 세션이 달라도 결과를 재사용
+def get_processed_result(cache, file_hashes, uploaded_files, trace_memory=False, job=None, executor=None):
+    key = ('result', file_hashes, trace_memory)
+    result = cache.get(key)
+    if result is None:
+        result = process_uploaded_files(uploaded_files, trace_memory, job, executor)
+        cache.put(key, result, result_size(result))
+    return result
+
+# 작업 스레드에서 실행: 결과/오류를 job에 기록
+def _run_processing_job(job, file_hashes, uploaded_files, trace_memory, cache, executor):
+    if job.finished:
+        return
+    job.status = 'running'
+    try:
+        job.result = get_processed_result(cache, file_hashes, uploaded_files, trace_memory, job, executor)
+        job.status = 'done'
+    except JobCancelled:
+        job.status = 'cancelled'
+    except BrokenProcessPool as e:
+        # 작업자 프로세스가 비정상 종료된 풀은 다시 쓸 수 없으므로 다음 작업에서 새로 만듦
+        get_parse_executor.clear()
+        job.error = str(e)
+        job.status = 'failed'
+    except Exception as e:
+        job.error = str(e)
+        job.status = 'failed'
+
+# 처리 작업을 작업 풀에 넣음
+def submit_processing_job(key, uploaded_files):
+    file_hashes, trace_memory = key
+    job = ProcessingJob(key, len(uploaded_files))
+    # cache_resource 값은 스크립트 스레드에서 꺼내 작업 스레드로 넘김
+    job.future = get_job_executor().submit(_run_processing_job, job, file_hashes, list(uploaded_files), trace_memory,
+                                           get_result_cache(), get_parse_executor())
+    return job
+
+# 처리 중인 작업의 진행 상황과 먼저 만들어진 표 (JOB_POLL_INTERVAL초마다 이 부분만 다시 그림)
+# - 작업이 끝나면 전체를 다시 실행해 결과 화면을 그림
+@st.fragment(run_every=JOB_POLL_INTERVAL)
+def show_job_progress(job):
+    if job.finished:
+        st.rerun()
+    progress = job.parsed_files / job.file_count if job.file_count else 0.0
+    st.progress(progress, text=job.message)
+    if st.button("⏹️ 처리 중단", key="cancel_job"):
+        job.cancel()
+        st.rerun()
+    partial_tables = dict(job.partial_tables)
+    if partial_tables:
+        st.caption("먼저 준비된 결과입니다. 처리가 끝나면 전체 결과가 표시됩니다.")
+        for name, df in partial_tables.items():
+            st.subheader(name)
+            st.dataframe(df.head(PREVIEW_PAGE_SIZES[0]), use_container_width=True)
+            st.caption(f"전체 {len(df):,}행 중 처음 {min(len(df), PREVIEW_PAGE_SIZES[0])}행")
+
+# 업로드 파일 처리 작업 (세션마다 하나)
+# - 업로드 파일이나 옵션이 바뀌면 이전 작업을 중단하고 새 작업을 넣음
+# - 처리가 끝났으면 결과를 반환하고, 처리 중이거나 중단됐으면 상태를 그리고 None을 반환
+def run_processing_job(uploaded_files, file_hashes, trace_memory):
+    key = (file_hashes, trace_memory)
+    job = st.session_state.get('processing_job')
+    if job is None or job.key != key:
+        if job is not None:
+            job.cancel()
+        job = submit_processing_job(key, uploaded_files)
+        st.session_state['processing_job'] = job
+    if job.status == 'done':
+        return job.result
+    if job.status == 'failed':
+        raise RuntimeError(job.error)
+    if job.status == 'cancelled':
+        st.warning("⏹️ 처리를 중단했습니다.")
+        if st.button("🔄 다시 처리"):
+            st.session_state['processing_job'] = submit_processing_job(key, uploaded_files)
+            st.rerun()
+        return None
+    show_job_progress(job)
+    return None
+
+# 내려받기 형식별 (표시 이름, 확장자, MIME 형식)
+# - xlsx: 과제정보 시트 + 동시참여 분석 시트 + 연구원별 원본/기간통합 시트
+# - csv/jsonl/parquet: 과제정보/연구원정보/기간통합/동시참여 분석 표마다 파일 하나를 zip으로 묶음
+EXPORT_OPTIONS = {
+    'xlsx': ('엑셀 (연구원별 시트)', 'xlsx', 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'),
+    'csv': ('CSV (표별 파일, zip)', 'zip', 'application/zip'),
+    'parquet': ('Parquet (표별 파일, zip)', 'zip', 'application/zip'),
+    'jsonl': ('JSON Lines (표별 파일, zip)', 'zip', 'application/zip'),
+}
+
+# 처리 결과를 fmt 형식 파일(bytes)로 변환
+# - 다운로드 버튼을 누를 때만 실행되고, (file_hashes, fmt)별로 결과 캐시에 넣어 같은 파일을 다시 만들지 않음
+def export_results(cache, file_hashes, fmt, result):
+    key = ('export', file_hashes, fmt)
+    data = cache.get(key)
+    if data is None:
+        data = _export_result(result, fmt)
+        cache.put(key, data, len(data))
+    return data
+
+# export_results에서 호출: 캐시 없이 처리 결과를 fmt 형식 파일(bytes)로 변환
+def _export_result(result, fmt):
+    # 과제정보가 없으면 과제정보 시트/파일 생략
+    project_df = result['project_df'] if not result['project_df'].empty else None
+    output_buffer = io.BytesIO()
+    if fmt == 'xlsx':
+        # 쓰기 전용 스트리밍 모드, 연구원별 원본/기간통합 시트
+        write_participation_workbook(
+            output_buffer,
+            project_df,
+            result['researcher_df'],
+            result['merged_df'],
+            merged_suffix='_기간통합',
+            extra_tables=result['concurrency_tables']
+        )
+    else:
+        tables = participation_tables(project_df, result['researcher_df'], result['merged_df'])
+        tables.update(result['concurrency_tables'])
+        write_tables_archive(output_buffer, tables, fmt)
+    return output_buffer.getvalue()
+
+# 업로드 파일들의 내용 해시 (업로드 순서)
+# - 세션 상태에 업로드 파일 id(file_id)별로 보관해 재실행(탭 클릭, 필터 변경 등)마다 다시 계산하지 않음
+# - 지금 올라와 있지 않은 파일의 해시는 버림
+def uploaded_file_hashes(uploaded_files):
+    stored = st.session_state.get('upload_hashes', {})
+    hashes = {}
+    for uploaded_file in uploaded_files:
+        digest = stored.get(uploaded_file.file_id)
+        if digest is None:
+            digest = content_hash(uploaded_file.getbuffer())
+        hashes[uploaded_file.file_id] = digest
+    st.session_state['upload_hashes'] = hashes
+    return tuple(hashes[uploaded_file.file_id] for uploaded_file in uploaded_files)
 
 def main():
     st.title("📊 연구과제 참여이력 통합 시스템")
@@ -55,6 +456,11 @@ def main():
         - 파일 형식이 다르면 오류가 발생할 수 있습니다
         - 다운로드 후 파일은 자동으로 삭제됩니다
         """)
+        
+        st.header("⏱️ 처리 성능")
+        show_profile = st.checkbox("단계별 처리 시간 보기", value=False)
+        trace_memory = st.checkbox("최대 메모리도 측정 (처리가 느려집니다)", value=False, disabled=not show_profile)
+        profile_panel = st.container()
     
     # 메인 영역
     col1, col2 = st.columns([2, 1])
@@ -78,202 +484,119 @@ def main():
     # 파일 처리 및 결과 표시
     if uploaded_files:
         try:
-            with st.spinner("파일을 처리하고 있습니다..."):
-                # 임시 디렉토리에 파일 저장
-                temp_dir = tempfile.mkdtemp()
-                temp_files = []
-                
-                for uploaded_file in uploaded_files:
-                    temp_path = os.path.join(temp_dir, uploaded_file.name)
-                    with open(temp_path, 'wb') as f:
-                        f.write(uploaded_file.getbuffer())
-                    temp_files.append(temp_path)
-                
-                # 기존 함수로 데이터 처리
-                all_project_info = []
-                all_researcher_info = []
-                
-                for temp_file in temp_files:
-                    try:
-                        project_info_list, researcher_info_list = parse_txt_file(temp_file)
-                        all_project_info.extend(project_info_list)
-                        all_researcher_info.extend(researcher_info_list)
-                    except Exception as e:
-                        st.error(f"파일 '{os.path.basename(temp_file)}' 처리 중 오류: {str(e)}")
-                
-                # 임시 파일들 삭제
-                for temp_file in temp_files:
-                    try:
-                        os.remove(temp_file)
-                    except:
-                        pass
-                try:
-                    os.rmdir(temp_dir)
-                except:
-                    pass
-                
-                if all_project_info or all_researcher_info:
+            # 업로드 파일 내용의 해시로 처리 결과 캐시 조회 (탭 클릭/다운로드 등 재실행 시 재처리 안 함)
+            # 처리는 백그라운드 작업으로 실행하고, 끝날 때까지 진행 상황과 먼저 만들어진 표를 보여 줌
+            # (크기 상한을 넘는 업로드는 해시를 계산하지 않고 바로 거절)
+            total_bytes = sum(uploaded_file.size for uploaded_file in uploaded_files)
+            if total_bytes > JOB_MAX_INPUT_MB * 1024 * 1024:
+                st.error(f"❌ 한 번에 처리할 수 있는 파일 크기({JOB_MAX_INPUT_MB} MB)를 넘었습니다. 파일을 나누어 올려주세요.")
+                result = None
+            else:
+                file_hashes = uploaded_file_hashes(uploaded_files)
+                result = run_processing_job(uploaded_files, file_hashes, show_profile and trace_memory)
+            
+            if result is not None:
+                if show_profile:
+                    with profile_panel:
+                        st.code(result['profiler'].format_report(), language=None)
+                        st.caption("같은 파일을 다시 처리하면 처음 처리할 때 측정한 값이 표시됩니다.")
+            
+                for index, message in result['errors']:
+                    st.error(f"파일 '{uploaded_files[index].name}' 처리 중 오류: {message}")
+            
+                project_df = result['project_df']
+                researcher_df = result['researcher_df']
+                merged_df = result['merged_df']
+                preview_indexes = result['preview_indexes']
+            
+                if not project_df.empty or not researcher_df.empty:
                     # 결과 표시
                     st.success("✅ 파일 처리 완료!")
-                    
+                    if result['duplicate_blocks']:
+                        st.info(f"🔁 여러 파일에 겹쳐 있는 같은 참여확인서 {result['duplicate_blocks']}건은 한 번만 반영했습니다.")
+                
                     # 탭으로 결과 표시
-                    tab1, tab2, tab3, tab4 = st.tabs(["📋 과제정보", "👥 연구원정보", "🔄 연구원정보_기간통합", "💾 엑셀 다운로드"])
-                    
+                    tab1, tab2, tab3, tab4, tab5 = st.tabs(["📋 과제정보", "👥 연구원정보", "🔄 연구원정보_기간통합", "📅 동시참여 분석", "💾 다운로드"])
+                
                     with tab1:
                         st.header("과제정보")
-                        if all_project_info:
-                            project_columns = ['과제번호', '연구기간', '과 제 명', '연구책임자', '지원기관', '지원사업', '소속연구소', '관리부서', '협약연구비', '공동연구원수', '연구보조원수']
-                            project_df = pd.DataFrame(all_project_info).drop_duplicates().reindex(columns=project_columns)
-                            st.dataframe(project_df, use_container_width=True)
-                            st.info(f"총 {len(project_df)}개의 과제 정보가 있습니다.")
+                        if not project_df.empty:
+                            project_index = preview_indexes['과제정보']
+                            show_indexed_preview(project_df, project_index, "project")
+                            st.info(f"총 {project_index.row_count}개의 과제 정보가 있습니다.")
                         else:
                             st.warning("과제 정보가 없습니다.")
-                    
+                
                     with tab2:
                         st.header("연구원정보")
-                        if all_researcher_info:
-                            researcher_columns = ['과제번호', '과 제 명', '성명', '주민번호', '연구원구분', '과정구분', '소속', '참여기간']
-                            researcher_df = pd.DataFrame(all_researcher_info).reindex(columns=researcher_columns)
-                            # 지원기관 정보 추가
-                            project_df_for_merge = pd.DataFrame(all_project_info)[['과제번호', '지원기관']].drop_duplicates()
-                            researcher_df = pd.merge(researcher_df, project_df_for_merge, on='과제번호', how='left')
-                            cols = list(researcher_df.columns)
-                            cols.insert(2, cols.pop(cols.index('지원기관')))
-                            researcher_df = researcher_df[cols]
-                            st.dataframe(researcher_df, use_container_width=True)
-                            st.info(f"총 {len(researcher_df)}개의 연구원 참여 기록이 있습니다.")
+                        if not researcher_df.empty:
+                            researcher_index = preview_indexes['연구원정보']
+                            show_indexed_preview(researcher_df, researcher_index, "researcher")
+                            st.info(f"총 {researcher_index.row_count}개의 연구원 참여 기록이 있습니다.")
                         else:
                             st.warning("연구원 정보가 없습니다.")
-                    
+                
                     with tab3:
                         st.header("연구원정보_기간통합")
-                        if all_researcher_info:
-                            researcher_columns = ['과제번호', '과 제 명', '성명', '주민번호', '연구원구분', '과정구분', '소속', '참여기간']
-                            researcher_df = pd.DataFrame(all_researcher_info).reindex(columns=researcher_columns)
-                            # 지원기관 정보 추가
-                            project_df_for_merge = pd.DataFrame(all_project_info)[['과제번호', '지원기관']].drop_duplicates()
-                            researcher_df = pd.merge(researcher_df, project_df_for_merge, on='과제번호', how='left')
-                            cols = list(researcher_df.columns)
-                            cols.insert(2, cols.pop(cols.index('지원기관')))
-                            researcher_df = researcher_df[cols]
-                            # 기간 병합 함수
-                            def parse_period(period):
-                                start, end = period.split('~')
-                                return start.strip(), end.strip()
-                            def merge_periods(periods):
-                                periods = sorted([parse_period(p) for p in periods], key=lambda x: x[0])
-                                merged = []
-                                for s, e in periods:
-                                    if not merged:
-                                        merged.append([s, e])
-                                    else:
-                                        last_s, last_e = merged[-1]
-                                        last_end = datetime.datetime.strptime(last_e, "%Y-%m-%d")
-                                        this_start = datetime.datetime.strptime(s, "%Y-%m-%d")
-                                        if (this_start - last_end).days == 1:
-                                            merged[-1][1] = e
-                                        else:
-                                            merged.append([s, e])
-                                return ['{} ~ {}'.format(s, e) for s, e in merged]
-                            # 연구원별로 기간 병합
-                            researcher_names = researcher_df['성명'].dropna().unique()
-                            all_merged_data = []
-                            for name in researcher_names:
-                                r_df = researcher_df[researcher_df['성명'] == name].copy()
-                                group_cols = [col for col in r_df.columns if col != '참여기간']
-                                merged_rows = []
-                                for _, group in r_df.groupby(group_cols, dropna=False):
-                                    periods = group['참여기간'].tolist()
-                                    for merged_period in merge_periods(periods):
-                                        row = group.iloc[0].to_dict()
-                                        row['참여기간'] = merged_period
-                                        merged_rows.append(row)
-                                all_merged_data.extend(merged_rows)
-                            if all_merged_data:
-                                merged_df = pd.DataFrame(all_merged_data).reindex(columns=researcher_df.columns)
-                                st.dataframe(merged_df, use_container_width=True)
-                                st.info(f"총 {len(merged_df)}개의 기간통합된 연구원 참여 기록이 있습니다.")
+                        if not researcher_df.empty:
+                            if not merged_df.empty:
+                                merged_index = preview_indexes['기간통합']
+                                show_indexed_preview(merged_df, merged_index, "merged")
+                                st.info(f"총 {merged_index.row_count}개의 기간통합된 연구원 참여 기록이 있습니다.")
                             else:
                                 st.warning("기간통합할 연구원 정보가 없습니다.")
                         else:
                             st.warning("연구원 정보가 없습니다.")
-                    
+                
                     with tab4:
-                        st.header("엑셀 파일 다운로드")
-                        st.markdown("처리된 데이터를 엑셀 파일로 다운로드할 수 있습니다.")
-                        # 엑셀 파일 생성
-                        output_buffer = io.BytesIO()
-                        with pd.ExcelWriter(output_buffer, engine='openpyxl') as writer:
-                            # 과제정보 시트
-                            if all_project_info:
-                                project_columns = ['과제번호', '연구기간', '과 제 명', '연구책임자', '지원기관', '지원사업', '소속연구소', '관리부서', '협약연구비', '공동연구원수', '연구보조원수']
-                                project_df = pd.DataFrame(all_project_info).drop_duplicates().reindex(columns=project_columns)
-                                project_df.to_excel(writer, sheet_name='과제정보', index=False)
-                            # 연구원별 시트 생성
-                            if all_researcher_info:
-                                researcher_columns = ['과제번호', '과 제 명', '성명', '주민번호', '연구원구분', '과정구분', '소속', '참여기간']
-                                researcher_df = pd.DataFrame(all_researcher_info).reindex(columns=researcher_columns)
-                                # 지원기관 정보 추가
-                                project_df_for_merge = pd.DataFrame(all_project_info)[['과제번호', '지원기관']].drop_duplicates()
-                                researcher_df = pd.merge(researcher_df, project_df_for_merge, on='과제번호', how='left')
-                                cols = list(researcher_df.columns)
-                                cols.insert(2, cols.pop(cols.index('지원기관')))
-                                researcher_df = researcher_df[cols]
-                                # 연구원별로 시트 분리
-                                researcher_names = researcher_df['성명'].dropna().unique()
-                                for name in researcher_names:
-                                    r_df = researcher_df[researcher_df['성명'] == name].copy()
-                                    r_df.to_excel(writer, sheet_name=name, index=False)
-                                    # 기간 병합 시트
-                                    def parse_period(period):
-                                        start, end = period.split('~')
-                                        return start.strip(), end.strip()
-                                    def merge_periods(periods):
-                                        periods = sorted([parse_period(p) for p in periods], key=lambda x: x[0])
-                                        merged = []
-                                        for s, e in periods:
-                                            if not merged:
-                                                merged.append([s, e])
-                                            else:
-                                                last_s, last_e = merged[-1]
-                                                last_end = datetime.datetime.strptime(last_e, "%Y-%m-%d")
-                                                this_start = datetime.datetime.strptime(s, "%Y-%m-%d")
-                                                if (this_start - last_end).days == 1:
-                                                    merged[-1][1] = e
-                                                else:
-                                                    merged.append([s, e])
-                                        return ['{} ~ {}'.format(s, e) for s, e in merged]
-                                    group_cols = [col for col in r_df.columns if col != '참여기간']
-                                    merged_rows = []
-                                    for _, group in r_df.groupby(group_cols, dropna=False):
-                                        periods = group['참여기간'].tolist()
-                                        for merged_period in merge_periods(periods):
-                                            row = group.iloc[0].to_dict()
-                                            row['참여기간'] = merged_period
-                                            merged_rows.append(row)
-                                    merged_researcher_df = pd.DataFrame(merged_rows).reindex(columns=r_df.columns)
-                                    merged_sheet_name = f"{name}_기간통합"
-                                    merged_researcher_df.to_excel(writer, sheet_name=merged_sheet_name, index=False)
-                        
-                        output_buffer.seek(0)
-                        
-                        # 다운로드 버튼
+                        st.header("동시참여 분석")
+                        concurrency_tables = result['concurrency_tables']
+                        summary_df = concurrency_tables['동시참여_요약']
+                        if not summary_df.empty:
+                            st.markdown("연구원별로 같은 기간에 참여한 과제 수와 기간이 겹치는 과제 쌍입니다 (기간통합 기준).")
+                            st.subheader("연구원별 요약")
+                            show_indexed_preview(summary_df, preview_indexes['동시참여_요약'], "concurrency_summary")
+                            st.subheader("기간이 겹치는 과제")
+                            show_indexed_preview(concurrency_tables['중복참여'], preview_indexes['중복참여'], "overlap_pairs")
+                            st.subheader("동시참여 과제 수 추이")
+                            show_indexed_preview(concurrency_tables['동시참여_추이'], preview_indexes['동시참여_추이'],
+                                                 "concurrency_timeline")
+                            pair_count = int(summary_df['중복참여쌍수'].sum())
+                            st.info(f"최대 동시참여 과제 수: {summary_df['최대동시참여과제수'].max()}개, "
+                                    f"기간이 겹치는 과제 쌍: {pair_count}개")
+                            if pair_count > preview_indexes['중복참여'].row_count:
+                                st.caption(f"겹치는 과제 쌍은 처음 {preview_indexes['중복참여'].row_count}개만 표시합니다.")
+                        else:
+                            st.warning("분석할 참여기간이 없습니다.")
+                
+                    with tab5:
+                        st.header("파일 다운로드")
+                        st.markdown("처리된 데이터를 엑셀 또는 CSV/Parquet/JSON Lines 파일로 다운로드할 수 있습니다.")
+                    
+                        fmt = st.radio(
+                            "파일 형식",
+                            list(EXPORT_OPTIONS),
+                            format_func=lambda key: EXPORT_OPTIONS[key][0],
+                            horizontal=True
+                        )
+                        label, extension, mime = EXPORT_OPTIONS[fmt]
                         now_str = datetime.datetime.now().strftime('%Y%m%d_%H%M')
-                        filename = f'연구과제_참여이력_통합_{now_str}.xlsx'
-                        
+                        filename = f'연구과제_참여이력_통합_{now_str}.{extension}'
+                    
+                        # 다운로드 버튼: 클릭할 때 파일을 만듦 (같은 입력/형식이면 캐시된 파일 사용)
                         st.download_button(
-                            label="📥 엑셀 파일 다운로드",
-                            data=output_buffer.getvalue(),
+                            label=f"📥 {label} 다운로드",
+                            data=functools.partial(export_results, get_result_cache(), file_hashes, fmt, result),
                             file_name=filename,
-                            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                            help="클릭하면 엑셀 파일이 다운로드됩니다"
+                            mime=mime,
+                            help="클릭하면 파일을 만들어 다운로드합니다"
                         )
-                        
-                        st.success("✅ 엑셀 파일이 준비되었습니다. 위 버튼을 클릭하여 다운로드하세요.")
-                
+                    
+                        st.success("✅ 다운로드 준비가 되었습니다. 위 버튼을 클릭하면 파일을 만들어 다운로드합니다.")
+            
                 else:
                     st.error("❌ 처리할 수 있는 데이터가 없습니다. 파일 형식을 확인해주세요.")
-                    
+                
         except Exception as e:
             st.error(f"❌ 처리 중 오류가 발생했습니다: {str(e)}")
             st.info("파일 형식이나 인코딩을 확인해주세요.")